@@ -19,7 +19,7 @@
 
 """Rubisco changelog generator."""
 
-from pathlib import Path
+import os
 from typing import ClassVar
 
 from rubisco.shared.api.kernel import Step
@@ -47,7 +47,7 @@ class ChangelogExtension(IRUExtension):
 
     def extension_can_load_now(self) -> bool:
         """Load the extension."""
-        return Path(".git").is_dir()
+        return os.path.isdir(".git")  # noqa: PTH112
 
     def reqs_is_solved(self) -> bool:
         """Check for requirements are solved."""
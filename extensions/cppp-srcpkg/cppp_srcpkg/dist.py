@@ -19,8 +19,12 @@
 
 """Rubisco source package builder."""
 
+import errno
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from shutil import copyfile
+from shutil import copy2, copyfile
+from typing import TYPE_CHECKING, TypeAlias
 
 from rubisco.shared.api.git import is_git_repo
 from rubisco.shared.api.kernel import (
@@ -35,61 +39,112 @@ from rubisco.shared.ktrigger import IKernelTrigger, call_ktrigger
 
 from cppp_srcpkg.ignore import Manifest
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
-def _dist(
+
+# A scheduled file copy and the size of its source file.
+_Copy: TypeAlias = tuple["Future[object]", int]
+
+
+# Errors of `os.link` which mean that hard links can't be used here.
+_LINK_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EPERM, errno.ENOTSUP}
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    # Remove what a previous dist left. It may be a link to the source.
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError as exc:
+        # Different file systems, or hard links are not supported.
+        if exc.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+        # A link shares the mode and times of the source, keep them here too.
+        # Otherwise the archive would depend on the file system.
+        copy2(src, dst)
+
+
+def _dist(  # pylint: disable=R0913 # noqa: PLR0913
     srcdir: Path,
     dstdir: Path,
-    task_name: str,
-    copied_size: int,
     manifest: Manifest,
-) -> int:
-    files = srcdir.iterdir()
-    if not files:
-        # We don't allow empty directory.
-        return 0
+    executor: ThreadPoolExecutor,
+    copies: list[_Copy],
+    *,
+    hardlink: bool,
+) -> None:
+    # `os.scandir` gives the file type and size with the listing, so we don't
+    # need to stat each file again.
+    with os.scandir(srcdir) as it:
+        entries = list(it)
+    # Read files in inode order. On most file systems it is closer to the
+    # on-disk layout than the listing order. Always 0 on Windows.
+    entries.sort(key=os.DirEntry.inode)
 
+    # Every walked directory is created, even if it is empty or all of its
+    # files are ignored.
     dstdir.mkdir(parents=True, exist_ok=True)
-    for file in files:
-        if file.resolve() == dstdir.resolve():
+    dstdir_resolved = dstdir.resolve()
+    for entry in entries:
+        file = Path(entry.path)
+        is_dir = entry.is_dir()
+        if is_dir and file.resolve() == dstdir_resolved:
             # Skip self. Destination may be the children of source dir.
             continue
-        relpath = file.relative_to(srcdir)
         if manifest.need_ignore(file):
             continue
-        if is_rubisco_project(file) and is_git_repo(file):
+        # Only directories can be subprojects. Checking files would stat each
+        # of them once for every supported config file name.
+        if is_dir and is_rubisco_project(file) and is_git_repo(file):
             config = load_project_config(file)
-            dist(file, dstdir / relpath, config)
-        elif file.is_dir():
-            copied_size = _dist(
+            dist(file, dstdir / entry.name, config, hardlink=hardlink)
+        elif is_dir:
+            _dist(
                 file,
-                dstdir / relpath,
-                task_name,
-                copied_size,
+                dstdir / entry.name,
                 manifest,
+                executor,
+                copies,
+                hardlink=hardlink,
             )
         else:
-            filepath = dstdir / relpath
-            # Keep symlink info.
-            copyfile(file, filepath, follow_symlinks=True)
-            if file.is_file():
-                copied_size += file.stat().st_size
-            call_ktrigger(
-                IKernelTrigger.on_progress,
-                task_name=task_name,
-                current=1.0,
-                delta=True,
-                status_msg=human_readable_size(copied_size),
-            )
-    return copied_size
+            filepath = dstdir / entry.name
+            size = entry.stat().st_size if entry.is_file() else 0
+            if hardlink:
+                future = executor.submit(_link_or_copy, file, filepath)
+            else:
+                # Keep symlink info.
+                future = executor.submit(
+                    copyfile,
+                    file,
+                    filepath,
+                    follow_symlinks=True,
+                )
+            copies.append((future, size))
 
 
-def dist(srcdir: Path, dstdir: Path, project: ProjectConfigration) -> None:
+def dist(
+    srcdir: Path,
+    dstdir: Path,
+    project: ProjectConfigration,
+    *,
+    hardlink: bool = False,
+) -> None:
     """Dist source package.
 
+    Files are copied by a thread pool while the source tree is still being
+    walked.
+
     Args:
         srcdir (Path): Source directory.
         dstdir (Path): Destination directory.
         project (ProjectConfigration): Project configuration.
+        hardlink (bool, optional): Hard link files instead of copying them
+            when possible. The files share their data, mode and times with
+            the source tree, so modifying the source tree before the
+            destination is packed changes the package too. Only use it if the
+            destination is removed after packing. Defaults to False.
 
     """
     manifest = Manifest(srcdir)
@@ -105,7 +160,20 @@ def dist(srcdir: Path, dstdir: Path, project: ProjectConfigration) -> None:
         task_name=project.name,
         total=-1,
     )
-    _dist(srcdir, dstdir, project.name, 0, manifest)
+    copies: list[_Copy] = []
+    copied_size = 0
+    with ThreadPoolExecutor() as executor:
+        _dist(srcdir, dstdir, manifest, executor, copies, hardlink=hardlink)
+        for future, size in copies:
+            future.result()
+            copied_size += size
+            call_ktrigger(
+                IKernelTrigger.on_progress,
+                task_name=project.name,
+                current=1.0,
+                delta=True,
+                status_msg=human_readable_size(copied_size),
+            )
     call_ktrigger(
         IKernelTrigger.on_finish_task,
         task_name=project.name,
@@ -49,6 +49,7 @@ def on_dist(options: list[Option[Any]], args: list[Argument[Any]]) -> None:
     archive_type = str(opts.get("archive-type")).split("+")
     archive_type = [x for x in archive_type if x]
     keep_srcdir = opts.get("keep-source-directory")
+    hardlink = opts.get("hardlink")
     name_format = format_str(opts.get("name-format"))
     dest = Path(cast("str", opts.get("destination")))
     src = Path(args_[0]) if len(args) > 0 else Path()
@@ -63,7 +64,14 @@ def on_dist(options: list[Option[Any]], args: list[Argument[Any]]) -> None:
     # Build source directory.
     dest_dir = dest / cast("str", name_format)
     project_config = load_project_config(src)
-    dist(src, dest_dir, project_config)
+    # A kept source directory must not share the file data with the source
+    # tree, so only link files into a directory which is removed later.
+    dist(
+        src,
+        dest_dir,
+        project_config,
+        hardlink=bool(hardlink) and not keep_srcdir,
+    )
 
     # Build source archive.
     for ar_type in archive_type:
@@ -134,6 +142,19 @@ def mount_to_cefs() -> None:
                     ),
                     default=False,
                 ),
+                Option[bool](
+                    name="hardlink",
+                    title=_("Hard link"),
+                    typecheck=bool,
+                    aliases=["l"],
+                    description=_(
+                        "Hard link files into the source directory instead "
+                        "of copying them when possible. Ignored if the "
+                        "source directory is kept. Don't modify the sources "
+                        "while packing. Defaults to 'false'.",
+                    ),
+                    default=False,
+                ),
                 Option[str](
                     name="name-format",
                     title=_("Name format"),
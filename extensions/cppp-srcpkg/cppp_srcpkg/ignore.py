@@ -81,15 +81,17 @@ class Manifest:
             bool: Return True if the file need ignore.
 
         """
-        filepath = file.relative_to(self.root) if file.is_absolute() else file
+        filepath = str(
+            file.relative_to(self.root) if file.is_absolute() else file,
+        )
         for pattern in self.include_patterns:
-            if fnmatch(str(filepath), pattern):
+            if fnmatch(filepath, pattern):
                 return True
 
         if self.repo is None:
             return False
 
-        return bool(self.repo.path_is_ignored(str(filepath)))
+        return bool(self.repo.path_is_ignored(filepath))
 
     def get_patterns(self) -> list[str]:
         """Get patterns list.
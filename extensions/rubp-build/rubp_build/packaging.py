@@ -22,6 +22,7 @@
 import json
 import tomllib
 from pathlib import Path
+from shutil import copyfile
 
 from rubisco.config import (
     APP_NAME,
@@ -58,6 +59,7 @@ class RuBP:
     license: Path | None
     distdir: Path
     version: str
+    compress_level: int
 
     def __init__(self, config: RUConfiguration) -> None:
         """Initialize RuBP."""
@@ -73,18 +75,24 @@ class RuBP:
         distdir = config.get("rubp-distdir", default="dist", valtype=str)
         self.distdir = Path(distdir)
         self.version = config.get("version", valtype=str) or "0.0.0"
+        # Lower levels pack much faster. Useful for development builds.
+        self.compress_level = config.get(
+            "rubp-compress-level",
+            default=9,
+            valtype=int,
+        )
 
     def get_requirements_txt(self) -> tuple[str, Path | None]:
         """Get requirements.txt data."""
         requirements_txt = self.config.path.parent / "requirements.txt"
         pyproject_toml = self.config.path.parent / "pyproject.toml"
         if requirements_txt.is_file():
-            res_ = ""
             with requirements_txt.open(encoding=DEFAULT_CHARSET) as f:
-                for line in f:
-                    if line.lstrip().startswith("rubisco"):
-                        continue
-                    res_ += line
+                res_ = "".join(
+                    line
+                    for line in f
+                    if not line.lstrip().startswith("rubisco")
+                )
             return (res_, requirements_txt)
 
         if pyproject_toml.is_file():
@@ -106,51 +114,49 @@ class RuBP:
 
         return "", None
 
-    def get_readme(self) -> tuple[str, Path | None]:
-        """Get readme data."""
+    def find_readme(self) -> Path | None:
+        """Find the readme file."""
         if self.readme:
-            return self.readme.read_text(encoding=DEFAULT_CHARSET), self.readme
-        readme_md = self.config.path.parent / "README.md"
-        readme_txt = self.config.path.parent / "README.txt"
-        readme = self.config.path.parent / "README"
-        if readme_md.is_file():
-            return readme_md.read_text(encoding=DEFAULT_CHARSET), readme_md
-        if readme_txt.is_file():
-            return readme_txt.read_text(encoding=DEFAULT_CHARSET), readme_txt
-        if readme.is_file():
-            return readme.read_text(encoding=DEFAULT_CHARSET), readme
+            return self.readme
+        for name in ("README.md", "README.txt", "README"):
+            readme = self.config.path.parent / name
+            if readme.is_file():
+                return readme
         logger.warning("No readme file found.")
         call_ktrigger(
             IKernelTrigger.on_warning,
             message=_("No readme file found."),
         )
-        return "", None
+        return None
 
-    def get_license(self) -> tuple[str, Path | None]:
-        """Get license data."""
+    def get_readme(self) -> tuple[str, Path | None]:
+        """Get readme data."""
+        readme = self.find_readme()
+        if readme is None:
+            return "", None
+        return readme.read_text(encoding=DEFAULT_CHARSET), readme
+
+    def find_license(self) -> Path | None:
+        """Find the license file."""
         if self.license:
-            return (
-                self.license.read_text(encoding=DEFAULT_CHARSET),
-                self.license,
-            )
-        license_md = self.config.path.parent / "LICENSE.md"
-        license_txt = self.config.path.parent / "LICENSE.txt"
-        license_ = self.config.path.parent / "LICENSE"
-        copying = self.config.path.parent / "COPYING"
-        if license_md.is_file():
-            return license_md.read_text(encoding=DEFAULT_CHARSET), license_md
-        if license_txt.is_file():
-            return license_txt.read_text(encoding=DEFAULT_CHARSET), license_txt
-        if license_.is_file():
-            return license_.read_text(encoding=DEFAULT_CHARSET), license_
-        if copying.is_file():
-            return copying.read_text(encoding=DEFAULT_CHARSET), copying
+            return self.license
+        for name in ("LICENSE.md", "LICENSE.txt", "LICENSE", "COPYING"):
+            license_ = self.config.path.parent / name
+            if license_.is_file():
+                return license_
         logger.warning("No license file found.")
         call_ktrigger(
             IKernelTrigger.on_warning,
             message=_("No license file found."),
         )
-        return "", None
+        return None
+
+    def get_license(self) -> tuple[str, Path | None]:
+        """Get license data."""
+        license_ = self.find_license()
+        if license_ is None:
+            return "", None
+        return license_.read_text(encoding=DEFAULT_CHARSET), license_
 
     def pack(self) -> None:
         """Pack project."""
@@ -184,29 +190,17 @@ class RuBP:
             ) as f:
                 f.write(requirements_txt)
 
-        # Get readme data.
-        readme, path = self.get_readme()
-        dst = self.bindir / RUBP_README_FILE_NAME
-        if path:
-            call_ktrigger(IKernelTrigger.on_copy, src=path, dst=dst)
-        if readme:
-            with dst.open(
-                "w",
-                encoding=DEFAULT_CHARSET,
-            ) as f:
-                f.write(readme)
-
-        # Get license data.
-        license_, path = self.get_license()
-        dst = self.bindir / RUBP_LICENSE_FILE_NAME
-        if path:
-            call_ktrigger(IKernelTrigger.on_copy, src=path, dst=dst)
-        if license_:
-            with dst.open(
-                "w",
-                encoding=DEFAULT_CHARSET,
-            ) as f:
-                f.write(license_)
+        # Copy readme and license. They are copied by the OS instead of being
+        # read into memory.
+        for find, name in (
+            (self.find_readme, RUBP_README_FILE_NAME),
+            (self.find_license, RUBP_LICENSE_FILE_NAME),
+        ):
+            path = find()
+            if path:
+                dst = self.bindir / name
+                call_ktrigger(IKernelTrigger.on_copy, src=path, dst=dst)
+                copyfile(path, dst)
 
         # Compress.
         compress(
@@ -214,7 +208,7 @@ class RuBP:
             self.distdir / f"{self.metadata.name}-{self.version}.rubp",
             start=self.bindir,
             compress_type="zip",
-            compress_level=9,
+            compress_level=self.compress_level,
             overwrite=True,
             cwd=self.config.path.parent,
         )
@@ -37,6 +37,7 @@ class RUBPPackStep(Step):
     license_: str | None
     distdir: str | None
     version: str | None
+    compress_level: int | None
 
     def init(self) -> None:
         """Init the step."""
@@ -66,6 +67,11 @@ class RUBPPackStep(Step):
             default=None,
             valtype=str | None,
         )
+        self.compress_level = self.raw_data.get(
+            "compress-level",
+            default=None,
+            valtype=int | None,
+        )
 
     def run(self) -> None:
         """Run the step."""
@@ -83,5 +89,7 @@ class RUBPPackStep(Step):
             rubp.distdir = Path(self.distdir)
         if self.version is not None:
             rubp.version = self.version
+        if self.compress_level is not None:
+            rubp.compress_level = self.compress_level
 
         rubp.pack()
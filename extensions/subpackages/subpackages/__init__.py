@@ -19,7 +19,7 @@
 
 """Rubisco subpackage manager."""
 
-from pathlib import Path
+import os
 from typing import ClassVar
 
 from rubisco.shared.api.kernel import Step
@@ -34,6 +34,9 @@ from subpackages.steps import FetchStep
 
 __all__ = ["instance"]
 
+# Resolved once per process. Walking $PATH is not free.
+_GIT = find_command("git", strict=False)
+
 
 class SubpackagesExtension(IRUExtension):
     """Rubisco subpackage manager."""
@@ -48,7 +51,7 @@ class SubpackagesExtension(IRUExtension):
 
     def extension_can_load_now(self) -> bool:
         """Load the extension."""
-        return not (find_command("git") is None or not Path(".git").is_dir())
+        return _GIT is not None and os.path.isdir(".git")  # noqa: PTH112
 
     def reqs_is_solved(self) -> bool:
         """Check for requirements are solved."""
@@ -19,6 +19,7 @@
 
 """Rubisco subpackage manager command events."""
 
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +49,7 @@ def on_fetch(options: list[Option[Any]], args: list[Argument[Any]]) -> None:
     protocol = opts.get("protocol", "http")
     shallow = opts.get("shallow", True)
     use_mirror = opts.get("use-mirror", True)
+    jobs = opts.get("jobs", 1)
     if protocol not in {"http", "ssh"}:
         raise RUValueError(
             fast_format_str(
@@ -57,7 +59,12 @@ def on_fetch(options: list[Option[Any]], args: list[Argument[Any]]) -> None:
             hint=_('We only support "http"(HTTP(s)) and "ssh"(SSH).'),
         )
     pkg = Package(Path.cwd())
-    pkg.fetch(protocol=protocol, shallow=shallow, use_direct=not use_mirror)
+    pkg.fetch(
+        protocol=protocol,
+        shallow=shallow,
+        use_direct=not use_mirror,
+        jobs=jobs,
+    )
 
 
 def on_list(options: list[Option[Any]], args: list[Argument[Any]]) -> None:
@@ -89,6 +96,108 @@ def on_list(options: list[Option[Any]], args: list[Argument[Any]]) -> None:
         call_ktrigger(IKernelTrigger.on_output, message=tree)
 
 
+# Options are built on first mount, after the locale domain is loaded, and
+# reused afterwards. `_()` lookups are stable for the process lifetime.
+@cache
+def _fetch_options() -> list[Option[Any]]:
+    return [
+        Option[str](
+            name="protocol",
+            title=_("Protocol"),
+            description=_("Protocol to use for fetching subpackages."),
+            typecheck=str,
+            aliases=["p"],
+            default="http",
+            ext_attributes={
+                "cli-advanced-options": [
+                    {
+                        "name": ["--http", "-H"],
+                        "help": _(
+                            "Use HTTP(s) to fetch Git subpackages.",
+                        ),
+                        "action": "store_const",
+                        "const": "http",
+                    },
+                    {
+                        "name": ["--ssh", "-S"],
+                        "help": _("Use SSH to fetch Git subpackages."),
+                        "action": "store_const",
+                        "const": "ssh",
+                    },
+                ],
+            },
+        ),
+        Option[bool](
+            name="shallow",
+            title=_("Shallow"),
+            description=_("Use shallow clone."),
+            typecheck=bool,
+            default=True,
+            ext_attributes={
+                "cli-advanced-options": [
+                    {
+                        "name": "--no-shallow",
+                        "help": _(
+                            "Disable shallow mode to clone subpackages.",
+                        ),
+                        "action": "store_false",
+                    },
+                ],
+            },
+        ),
+        Option[bool](
+            name="use-mirror",
+            title=_("Use Mirror"),
+            description=_(
+                "Enable mirror speedtest and auto selection.",
+            ),
+            typecheck=bool,
+            default=True,
+            ext_attributes={
+                "cli-advanced-options": [
+                    {
+                        "name": "-m",
+                        "help": _(
+                            "Use mirror to fetch Git subpackages.",
+                        ),
+                        "action": "store_true",
+                    },
+                    {
+                        "name": "-M",
+                        "help": _(
+                            "Disable mirror speedtest and auto selection.",
+                        ),
+                        "action": "store_false",
+                    },
+                ],
+            },
+        ),
+        Option[int](
+            name="jobs",
+            title=_("Jobs"),
+            description=_(
+                "Maximum number of subpackages to fetch in parallel.",
+            ),
+            typecheck=int,
+            aliases=["j"],
+            default=1,
+        ),
+    ]
+
+
+@cache
+def _list_options() -> list[Option[Any]]:
+    return [
+        Option[bool](
+            name="recursive",
+            title=_("Recursive"),
+            description=_("List subpackages recursively."),
+            typecheck=bool,
+            default=True,
+        ),
+    ]
+
+
 def mount_to_cefs() -> None:
     """Mount cefs events."""
     EventPath("/subpackages").mkdir(
@@ -103,79 +212,7 @@ def mount_to_cefs() -> None:
                 ),
             ],
         ),
-        options=[
-            Option[str](
-                name="protocol",
-                title=_("Protocol"),
-                description=_("Protocol to use for fetching subpackages."),
-                typecheck=str,
-                aliases=["p"],
-                default="http",
-                ext_attributes={
-                    "cli-advanced-options": [
-                        {
-                            "name": ["--http", "-H"],
-                            "help": _(
-                                "Use HTTP(s) to fetch Git subpackages.",
-                            ),
-                            "action": "store_const",
-                            "const": "http",
-                        },
-                        {
-                            "name": ["--ssh", "-S"],
-                            "help": _("Use SSH to fetch Git subpackages."),
-                            "action": "store_const",
-                            "const": "ssh",
-                        },
-                    ],
-                },
-            ),
-            Option[bool](
-                name="shallow",
-                title=_("Shallow"),
-                description=_("Use shallow clone."),
-                typecheck=bool,
-                default=True,
-                ext_attributes={
-                    "cli-advanced-options": [
-                        {
-                            "name": "--no-shallow",
-                            "help": _(
-                                "Disable shallow mode to clone subpackages.",
-                            ),
-                            "action": "store_false",
-                        },
-                    ],
-                },
-            ),
-            Option[bool](
-                name="use-mirror",
-                title=_("Use Mirror"),
-                description=_(
-                    "Enable mirror speedtest and auto selection.",
-                ),
-                typecheck=bool,
-                default=True,
-                ext_attributes={
-                    "cli-advanced-options": [
-                        {
-                            "name": "-m",
-                            "help": _(
-                                "Use mirror to fetch Git subpackages.",
-                            ),
-                            "action": "store_true",
-                        },
-                        {
-                            "name": "-M",
-                            "help": _(
-                                "Disable mirror speedtest and auto selection.",
-                            ),
-                            "action": "store_false",
-                        },
-                    ],
-                },
-            ),
-        ],
+        options=_fetch_options(),
         description=_("Fetch subpackages."),
     )
     EventPath("/subpackages/list").mkfile(
@@ -187,14 +224,6 @@ def mount_to_cefs() -> None:
                 ),
             ],
         ),
-        options=[
-            Option[bool](
-                name="recursive",
-                title=_("Recursive"),
-                description=_("List subpackages recursively."),
-                typecheck=bool,
-                default=True,
-            ),
-        ],
+        options=_list_options(),
         description=_("List subpackages."),
     )
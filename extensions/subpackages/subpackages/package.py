@@ -19,9 +19,13 @@
 
 """Package class."""
 
-from dataclasses import dataclass
+import os
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeAlias
 
 from rubisco.shared.api.exception import (
     RUNotRubiscoProjectError,
@@ -37,10 +41,91 @@ from rubisco.shared.api.l10n import _
 from rubisco.shared.api.variable import fast_format_str
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from rubisco.lib.variable.autoformatdict import AutoFormatDict
 
 
-@dataclass
+# Folded names of each listed directory. None if it can't be listed.
+DirCache: TypeAlias = dict[Path, frozenset[str] | None]
+
+# Directory caches are shared by the fetch workers. A listing is filled and
+# invalidated under this lock, so a scan started before a clone can't store
+# its stale result after the clone invalidated it.
+_dir_cache_lock = threading.Lock()
+
+
+def _join_path(base: str, path: str) -> Path:
+    # Join on the string form. Cheaper than `Path.__truediv__` for each ref.
+    if os.path.isabs(path):  # noqa: PTH117
+        return Path(path)
+    return Path(f"{base}/{path}")
+
+
+def _fold_name(name: str) -> str:
+    # File systems may ignore case or Unicode normalization. Compare folded
+    # names, so a missing folded name means that the file is missing.
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+def _list_dir(dir_cache: DirCache, parent: Path) -> frozenset[str] | None:
+    with _dir_cache_lock:
+        if parent in dir_cache:
+            return dir_cache[parent]
+        entries: frozenset[str] | None
+        try:
+            with os.scandir(parent) as it:
+                entries = frozenset(_fold_name(entry.name) for entry in it)
+        except FileNotFoundError:
+            entries = frozenset()
+        except OSError:
+            entries = None
+        dir_cache[parent] = entries
+        return entries
+
+
+def _parse_subpkg_refs(
+    config: ProjectConfigration,
+    path: Path,
+    dir_cache: DirCache,
+) -> "list[SubpackageReference]":
+    subpkgs: list[SubpackageReference] = []
+    subpkg_dict = config.config.get("subpackages", {}, valtype=dict)
+    subpkg_dict: AutoFormatDict
+    base = str(path)
+    for name, subpkg in subpkg_dict.items():
+        if not isinstance(subpkg, dict):  # type: ignore[union-attr]
+            msg = fast_format_str(
+                _("Subpackage reference ${{name}} is not a dict."),
+                fmt={"name": name},
+            )
+            raise RUTypeError(msg)
+        subpkg: AutoFormatDict
+        branch = subpkg.get("branch", valtype=str)
+        url = subpkg.get("url", valtype=str)
+        paths = subpkg.get("path", valtype=list[str] | str)
+        if isinstance(paths, str):
+            paths = [paths]
+        if not paths:
+            raise RUValueError(
+                fast_format_str(
+                    _("Subpackage reference ${{name}} has no path."),
+                    fmt={"name": name},
+                ),
+            )
+        spr = SubpackageReference(
+            name=name,
+            branch=branch,
+            url=url,
+            paths=[_join_path(base, p) for p in paths],
+            dir_cache=dir_cache,
+        )
+        subpkgs.append(spr)
+
+    return subpkgs
+
+
+@dataclass(slots=True)
 class SubpackageReference:
     """Subpackage reference."""
 
@@ -50,6 +135,30 @@ class SubpackageReference:
     paths: list[Path]
     # We support multiple paths. If one of its path exists, we will use it.
 
+    # Directory listings shared by the references of one package. Missing
+    # sibling paths are found with one `os.scandir` per parent directory
+    # instead of one `stat` per path.
+    dir_cache: DirCache | None = field(default=None, repr=False, compare=False)
+
+    def path_exists(self, path: Path) -> bool:
+        """Check if one of the subpackage paths exists.
+
+        Args:
+            path (Path): The path to check.
+
+        Returns:
+            bool: True if the path exists.
+
+        """
+        # The listing is only trusted if the name is missing. A listed name
+        # may be a dangling symlink or differ in case, so check it again.
+        if self.dir_cache is None or path.name in {"", ".", ".."}:
+            return path.exists()
+        entries = _list_dir(self.dir_cache, path.parent)
+        if entries is not None and _fold_name(path.name) not in entries:
+            return False
+        return path.exists()
+
     def exists(self) -> bool:
         """Check if the subpackage exists.
 
@@ -57,7 +166,7 @@ class SubpackageReference:
             bool: True if the subpackage exists.
 
         """
-        return any(path.exists() for path in self.paths)
+        return any(self.path_exists(path) for path in self.paths)
 
     def get_path(self) -> Path:
         """Get the path of the subpackage.
@@ -67,7 +176,7 @@ class SubpackageReference:
 
         """
         for path in self.paths:
-            if path.exists():
+            if self.path_exists(path):
                 return path
         return self.paths[0]
 
@@ -103,6 +212,9 @@ class SubpackageReference:
             shallow=shallow,
             use_fastest=not use_direct,
         )
+        if self.dir_cache is not None:
+            with _dir_cache_lock:
+                self.dir_cache.pop(path.parent, None)
 
     def fetch_subpackages(
         self,
@@ -125,7 +237,7 @@ class SubpackageReference:
 
         """
         path = self.get_path()
-        if not path.exists():
+        if not self.path_exists(path):
             # fetch() should be called before this method. For BFS iteration.
             raise RUValueError(
                 fast_format_str(
@@ -150,11 +262,21 @@ class SubpackageReference:
 class Package:
     """Package class."""
 
+    __slots__ = (
+        "_dir_cache",
+        "_subpackages",
+        "config",
+        "name",
+        "path",
+        "subpackage_refs",
+    )
+
     name: str
     path: Path
     config: ProjectConfigration
     subpackage_refs: list[SubpackageReference]
-    subpackages: "list[Package | None]"
+    _subpackages: "list[Package | None] | None"
+    _dir_cache: DirCache
 
     def __init__(self, path: Path) -> None:
         """Parse a rubisco package.
@@ -167,50 +289,59 @@ class Package:
         self.name = config.name
         self.path = path
         self.config = config
+        self._subpackages = None
+        self._dir_cache = {}
         self._load_subpkg_refs()
-        self._load_subpackages()
+
+    @property
+    def subpackages(self) -> "list[Package | None]":
+        """Get the subpackages. They are loaded on first access.
+
+        Returns:
+            list[Package | None]: The subpackages. None if the subpackage
+                does not exist.
+
+        """
+        if self._subpackages is None:
+            self._subpackages = self._load_subpackages()
+        return self._subpackages
+
+    @subpackages.setter
+    def subpackages(self, value: "list[Package | None]") -> None:
+        self._subpackages = value
 
     def _load_subpkg_refs(self) -> None:
-        subpkgs: list[SubpackageReference] = []
-        subpkg_dict = self.config.config.get("subpackages", {}, valtype=dict)
-        subpkg_dict: AutoFormatDict
-        for name, subpkg in subpkg_dict.items():
-            if not isinstance(subpkg, dict):  # type: ignore[union-attr]
-                msg = fast_format_str(
-                    _("Subpackage reference ${{name}} is not a dict."),
-                    fmt={"name": name},
-                )
-                raise RUTypeError(msg)
-            subpkg: AutoFormatDict
-            branch = subpkg.get("branch", valtype=str)
-            url = subpkg.get("url", valtype=str)
-            paths = subpkg.get("path", valtype=list[str] | str)
-            if isinstance(paths, str):
-                paths = [paths]
-            if not paths:
-                raise RUValueError(
-                    fast_format_str(
-                        _("Subpackage reference ${{name}} has no path."),
-                        fmt={"name": name},
-                    ),
-                )
-            spr = SubpackageReference(
-                name=name,
-                branch=branch,
-                url=url,
-                paths=[self.path / Path(p) for p in paths],
-            )
-            subpkgs.append(spr)
+        self.subpackage_refs = _parse_subpkg_refs(
+            self.config,
+            self.path,
+            self._dir_cache,
+        )
 
-        self.subpackage_refs = subpkgs
+    @classmethod
+    def refs_only(cls, path: Path) -> list[SubpackageReference]:
+        """Load the subpackage references of a package without the package.
 
-    def _load_subpackages(self) -> None:
-        self.subpackages = []
-        for subpkg in self.subpackage_refs:
-            if subpkg.exists():
-                self.subpackages.append(Package(subpkg.get_path()))
-            else:
-                self.subpackages.append(None)
+        Args:
+            path (Path): The path of the package.
+
+        Returns:
+            list[SubpackageReference]: The subpackage references.
+
+        """
+        return _parse_subpkg_refs(load_project_config(path), path, {})
+
+    def clear_dir_cache(self) -> None:
+        """Forget the directory listings cached by the subpackage references.
+
+        Call it after the subpackage directories are changed.
+        """
+        self._dir_cache.clear()
+
+    def _load_subpackages(self) -> "list[Package | None]":
+        return [
+            Package(subpkg.get_path()) if subpkg.exists() else None
+            for subpkg in self.subpackage_refs
+        ]
 
     def fetch(
         self,
@@ -218,35 +349,148 @@ class Package:
         *,
         shallow: bool = True,
         use_direct: bool = False,
+        jobs: int = 1,
     ) -> list["Package | None"]:
         """Fetch the package.
 
+        With one job, subpackages are fetched one by one. With more jobs,
+        they are fetched in a pipeline: as soon as a subpackage is cloned,
+        its own subpackages are queued, without waiting for its siblings to
+        finish.
+
         Args:
             protocol (str): The protocol to use.
             shallow (bool, optional): Whether to use shallow clone. Defaults to
                 True.
             use_direct (bool, optional): Whether to use direct url without
                 mirror speed test. Defaults to False.
+            jobs (int, optional): The maximum number of subpackages fetched
+                at the same time. Defaults to 1.
 
         Returns:
             list[Package | None]: The fetched packages.
 
         """
-        refs = self.subpackage_refs
-        for subpkg in refs:
-            subpkg.fetch(
-                protocol=protocol,
-                shallow=shallow,
-                use_direct=use_direct,
-            )
+        if jobs <= 1:
+            refs = self.subpackage_refs
+            for subpkg in refs:
+                subpkg.fetch(
+                    protocol=protocol,
+                    shallow=shallow,
+                    use_direct=use_direct,
+                )
+            self.subpackages = [
+                subpkg.fetch_subpackages(
+                    protocol,
+                    shallow=shallow,
+                    use_direct=use_direct,
+                )
+                for subpkg in refs
+            ]
+            return self.subpackages
 
-        subpkgs = [
-            subpkg.fetch_subpackages(
-                protocol,
-                shallow=shallow,
-                use_direct=use_direct,
+        pipeline = _FetchPipeline(
+            protocol,
+            shallow=shallow,
+            use_direct=use_direct,
+            jobs=jobs,
+        )
+        pipeline.run(self)
+        return self.subpackages
+
+
+class _FetchPipeline:  # pylint: disable=R0902
+    """Fetch a subpackage DAG with one shared thread pool."""
+
+    def __init__(
+        self,
+        protocol: str,
+        *,
+        shallow: bool,
+        use_direct: bool,
+        jobs: int,
+    ) -> None:
+        self.protocol = protocol
+        self.shallow = shallow
+        self.use_direct = use_direct
+        self.jobs = max(jobs, 1)
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._pending = 0
+        self._errors: list[BaseException] = []
+        # The first reference to a path fetches it, the others only link it.
+        self._packages: dict[Path, Package | None] = {}
+        self._links: list[tuple[Package, int, Path]] = []
+        self._executor: ThreadPoolExecutor
+
+    def run(self, root: Package) -> None:
+        """Fetch all subpackages of the root package recursively.
+
+        Args:
+            root (Package): The root package.
+
+        """
+        with ThreadPoolExecutor(max_workers=self.jobs) as self._executor:
+            with self._lock:
+                self._pending += 1
+            self._expand(root)
+            self._task_done()
+            self._done.wait()
+
+        if self._errors:
+            raise self._errors[0]
+
+        root.clear_dir_cache()
+        for pkg, idx, path in self._links:
+            pkg.subpackages[idx] = self._packages[path]
+            pkg.clear_dir_cache()
+
+    def _expand(self, pkg: Package) -> None:
+        pkg.subpackages = [None] * len(pkg.subpackage_refs)
+        for idx, ref in enumerate(pkg.subpackage_refs):
+            with self._lock:
+                path = self._select_path(ref)
+                self._links.append((pkg, idx, path))
+                if path in self._packages or self._errors:
+                    continue
+                self._packages[path] = None
+                self._pending += 1
+            self._executor.submit(self._fetch, ref, path).add_done_callback(
+                self._on_done,
             )
-            for subpkg in refs
-        ]
-        self.subpackages = subpkgs
-        return subpkgs
+
+    def _select_path(self, ref: SubpackageReference) -> Path:
+        # Like `SubpackageReference.get_path()`, but paths which are still
+        # being fetched by another reference count as existing.
+        for path in ref.paths:
+            resolved = path.resolve()
+            if resolved in self._packages or ref.path_exists(path):
+                return resolved
+        return ref.paths[0].resolve()
+
+    def _fetch(self, ref: SubpackageReference, path: Path) -> None:
+        ref.fetch(
+            protocol=self.protocol,
+            shallow=self.shallow,
+            use_direct=self.use_direct,
+        )
+        try:
+            pkg = Package(ref.get_path())
+        except RUNotRubiscoProjectError:
+            return
+        with self._lock:
+            self._packages[path] = pkg
+        self._expand(pkg)
+
+    def _on_done(self, future: "Future[None]") -> None:
+        exc = future.exception()
+        if exc is not None:
+            with self._lock:
+                self._errors.append(exc)
+        self._task_done()
+
+    def _task_done(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._done.set()
@@ -19,7 +19,8 @@
 
 """Subpackage list utils."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from queue import Queue
 from typing import TypeAlias
@@ -32,7 +33,7 @@ from subpackages.package import Package, SubpackageReference
 __all__ = ["load_subpkg_list"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SubpackageRepr:
     """Subpackage representation."""
 
@@ -44,36 +45,36 @@ class SubpackageRepr:
     cwd: Path
 
     is_duplicate: bool = False
+    relpath: Path = field(init=False, repr=False, compare=False)
 
-    def __str__(self) -> str:
-        """Return the string representation of the subpackage."""
+    def __post_init__(self) -> None:
+        """Resolve the path relative to the current working directory."""
         try:
-            relpath = Path(self.path).relative_to(self.cwd)
+            self.relpath = Path(self.path).relative_to(self.cwd)
         except ValueError:
-            relpath = Path(self.path)
-        path = make_pretty(relpath)
-        res = ""
+            self.relpath = Path(self.path)
+
+    def __str__(self) -> str:
+        """Return the string representation of the subpackage."""
+        path = make_pretty(self.relpath)
 
         if self.is_duplicate:
-            res += f"⬅️ [cyan]{self.name}[/cyan]\t {path}"
-        elif self.is_fetched:
-            res += f"📂 [green]{self.name}[/green]\t"
-            if self.url:
-                res += (
-                    f"[blue]{self.url}[/blue] [yellow]([/yellow][red]"
-                    f"{self.branch}[/red][yellow])[/yellow] [blue]=>[/blue] "
-                )
-            res += f"[bold]{path}[/bold]"
-        else:
-            res += f"📦 [gray50]{self.name}[/gray50]\t"
-            if self.url:
-                res += (
-                    f"[blue]{self.url}[/blue] [yellow]([/yellow][red]"
-                    f"{self.branch}[/red][yellow])[/yellow] [blue]=>[/blue] "
-                )
-            res += f"[gray50]{path}[/gray50]"
-
-        return res
+            return f"⬅️ [cyan]{self.name}[/cyan]\t {path}"
+
+        url_part = (
+            f"[blue]{self.url}[/blue] [yellow]([/yellow][red]{self.branch}"
+            "[/red][yellow])[/yellow] [blue]=>[/blue] "
+            if self.url
+            else ""
+        )
+        if self.is_fetched:
+            return (
+                f"📂 [green]{self.name}[/green]\t{url_part}[bold]{path}[/bold]"
+            )
+        return (
+            f"📦 [gray50]{self.name}[/gray50]\t{url_part}"
+            f"[gray50]{path}[/gray50]"
+        )
 
 
 _QueueItem: TypeAlias = tuple[Tree[SubpackageRepr], SubpackageReference]
@@ -85,12 +86,10 @@ def _load_subpkg_list(
     loaded: set[str],
     cwd: Path,
 ) -> None:
-    subpkg = Package(pkg.get_path())
-
     subpkgs_load_queue: Queue[_QueueItem] = Queue()
-    for p in subpkg.subpackage_refs:
+    for p in Package.refs_only(pkg.get_path()):
         path = p.get_path().resolve()
-        uid = str(path) if p.exists() else p.url
+        uid = sys.intern(str(path) if p.exists() else p.url)
         is_duplicate = uid in loaded
         subtree = Tree(
             SubpackageRepr(
@@ -134,7 +133,7 @@ def load_subpkg_list(
         bool: Return True if no subpackages are found, False otherwise.
 
     """
-    if not pkg.subpackages:
+    if not pkg.subpackage_refs:
         return True
 
     loaded: set[str] = set()
@@ -142,7 +141,7 @@ def load_subpkg_list(
     subpkgs_load_queue: Queue[_QueueItem] = Queue()
     for p in pkg.subpackage_refs:
         path = p.get_path().resolve()
-        uid = str(path) if p.exists() else p.url
+        uid = sys.intern(str(path) if p.exists() else p.url)
         subtree = Tree(
             SubpackageRepr(
                 name=p.name,
@@ -20,6 +20,7 @@
 """Rubisco CLI for CommandEventFS debugging."""
 
 import shlex
+from collections.abc import Callable
 from pathlib import Path
 from traceback import FrameSummary
 from typing import Any
@@ -53,11 +54,20 @@ class RubiscoCEFSDebuggerCLI:
     lexer: CEFSDebuggerCLICommandLexer
     prompt_session: PromptSession[str]
     cwd: EventPath
+    commands: dict[str, Callable[[list[str]], None]]
 
     def __init__(self) -> None:
         """Initialize the RubiscoCEFSDebuggerCLI class."""
         self.lexer = CEFSDebuggerCLICommandLexer()
         self.cwd = EventPath("/")
+        self.commands = {
+            "clear": self.clear,
+            "cd": self.cd,
+            "ls": self.ls,
+            "cat": self.cat,
+            "stat": self.stat,
+            "help": self.help,
+        }
 
         self.prompt_session = PromptSession(
             history=InMemoryHistory(),
@@ -114,18 +124,9 @@ class RubiscoCEFSDebuggerCLI:
             raise SystemExit
         if cmd.startswith("#"):
             return
-        if cmd == "clear":
-            self.clear(rest)
-        elif cmd == "cd":
-            self.cd(rest)
-        elif cmd == "ls":
-            self.ls(rest)
-        elif cmd == "cat":
-            self.cat(rest)
-        elif cmd == "stat":
-            self.stat(rest)
-        elif cmd == "help":
-            self.help(rest)
+        command = self.commands.get(cmd)
+        if command is not None:
+            command(rest)
         else:
             rich.print(
                 fast_format_str(
@@ -20,10 +20,10 @@
 """Argument for CLI."""
 
 import argparse
+from functools import cache
 from typing import Any
 
 from rubisco.cli.argparse_generator import gen_argparse
-from rubisco.cli.cefs_dbg.cli import RubiscoCEFSDebuggerCLI
 from rubisco.cli.main.help_formatter import RUHelpFormatter
 from rubisco.cli.main.version_action import CLIVersionAction, version_callback
 from rubisco.cli.output import output_step
@@ -44,8 +44,8 @@ from rubisco.kernel.config_file import config_file
 from rubisco.lib.l10n import _
 
 __all__ = [
-    "early_arg_parser",
     "get_arg_parser",
+    "get_early_arg_parser",
     "init_arg_parser",
 ]
 
@@ -61,6 +61,11 @@ def cefs_callback(
         args (list[Argument[Any]]): Arguments of command line.
 
     """
+    # The debugger pulls in prompt_toolkit. Import it only when it is used.
+    from rubisco.cli.cefs_dbg.cli import (  # pylint: disable=C0415 # noqa: PLC0415
+        RubiscoCEFSDebuggerCLI,
+    )
+
     try:
         RubiscoCEFSDebuggerCLI().run()
     except (SystemExit, KeyboardInterrupt, EOFError):
@@ -246,29 +251,41 @@ def get_arg_parser() -> argparse.ArgumentParser:
     return arg_parser
 
 
-# Early argument parser.
-early_arg_parser = argparse.ArgumentParser(
-    description="Rubisco CLI",
-    add_help=False,
-    allow_abbrev=True,
-    formatter_class=RUHelpFormatter,
-)
+@cache
+def get_early_arg_parser() -> argparse.ArgumentParser:
+    """Get the early argument parser.
 
-# For "rubisco --version".
-early_arg_parser.add_argument(
-    "--root",
-    type=str,
-    help=_("Project root directory."),
-    action="store",
-    dest="root_directory",
-)
+    It parses the arguments which are needed before the extensions and the
+    project are loaded. It is only built on the first call.
 
-# For "rubisco --used-colors=COLORS"
-early_arg_parser.add_argument(
-    "--used-prompt-colors",
-    type=set,
-    help=_("Prompt colors used by rubisco parent process."),
-    action="store",
-    default=set(),
-    dest="used_prompt_colors",
-)
+    Returns:
+        argparse.ArgumentParser: The early argument parser.
+
+    """
+    early_arg_parser = argparse.ArgumentParser(
+        description="Rubisco CLI",
+        add_help=False,
+        allow_abbrev=True,
+        formatter_class=RUHelpFormatter,
+    )
+
+    # For "rubisco --root=DIR".
+    early_arg_parser.add_argument(
+        "--root",
+        type=str,
+        help=_("Project root directory."),
+        action="store",
+        dest="root_directory",
+    )
+
+    # For "rubisco --used-colors=COLORS"
+    early_arg_parser.add_argument(
+        "--used-prompt-colors",
+        type=set,
+        help=_("Prompt colors used by rubisco parent process."),
+        action="store",
+        default=set(),
+        dest="used_prompt_colors",
+    )
+
+    return early_arg_parser
@@ -58,16 +58,16 @@ if TYPE_CHECKING:
 __all__ = ["register_extman_cmds"]
 
 
+_ENVTYPE_NAMES = {
+    EnvType.GLOBAL: _("global"),
+    EnvType.USER: _("user"),
+    EnvType.WORKSPACE: _("workspace"),
+    EnvType.FOREIGN: _("foreign-package"),
+}
+
+
 def _get_envtype_str(env_type: EnvType) -> str:
-    if env_type == EnvType.GLOBAL:
-        return _("global")
-    if env_type == EnvType.USER:
-        return _("user")
-    if env_type == EnvType.WORKSPACE:
-        return _("workspace")
-    if env_type == EnvType.FOREIGN:
-        return _("foreign-package")
-    return _("unknown")
+    return _ENVTYPE_NAMES.get(env_type) or _("unknown")
 
 
 def _list_pkgs(
@@ -127,72 +127,38 @@ def list_packages(
 
     if not pkg_list:
         return
-    for pkg in pkg_list:
-        str_envname = _get_envtype_str(pkg.env_type)
-
-        call_ktrigger(
-            IKernelTrigger.on_output,
-            message=f"[green]{pkg.name}[/green]/[bold]{str_envname}[/bold]"
-            f" [cyan]{pkg.version:s}[/cyan]\n\t{pkg.description}",
-        )
-
-
-def _show_pkgs(pkg: ExtensionPackageInfo) -> None:
+    # Output the whole list at once instead of one write for each package.
     call_ktrigger(
         IKernelTrigger.on_output,
-        message=fast_format_str(
-            _("Package: [green]${{name}}[/green]"),
-            fmt={"name": pkg.name},
+        message="\n".join(
+            f"[green]{pkg.name}[/green]/"
+            f"[bold]{_get_envtype_str(pkg.env_type)}[/bold]"
+            f" [cyan]{pkg.version:s}[/cyan]\n\t{pkg.description}"
+            for pkg in pkg_list
         ),
     )
-    call_ktrigger(
-        IKernelTrigger.on_output,
-        message=fast_format_str(
-            _("Version: [cyan]${{ver}}[/cyan]"),
-            fmt={"ver": str(pkg.version)},
-        ),
-    )
-    call_ktrigger(
-        IKernelTrigger.on_output,
-        message=fast_format_str(
+
+
+def _show_pkgs(pkg: ExtensionPackageInfo) -> None:
+    fields = [
+        (_("Package: [green]${{name}}[/green]"), {"name": pkg.name}),
+        (_("Version: [cyan]${{ver}}[/cyan]"), {"ver": str(pkg.version)}),
+        (
             _("Installation Location: ${{loc}}"),
-            fmt={"loc": _get_envtype_str(pkg.env_type)},
+            {"loc": _get_envtype_str(pkg.env_type)},
         ),
-    )
-    call_ktrigger(
-        IKernelTrigger.on_output,
-        message=fast_format_str(
+        (
             _("Maintainers: ${{maintainers}}"),
-            fmt={"maintainers": ", ".join(pkg.maintainers)},
+            {"maintainers": ", ".join(pkg.maintainers)},
         ),
-    )
+        (_("Homepage: ${{homepage}}"), {"homepage": pkg.homepage}),
+        (_("License: ${{license}}"), {"license": pkg.pkg_license}),
+        (_("Tags: ${{tags}}"), {"tags": ", ".join(pkg.tags)}),
+        (_("Description: ${{desc}}"), {"desc": pkg.description}),
+    ]
     call_ktrigger(
         IKernelTrigger.on_output,
-        message=fast_format_str(
-            _("Homepage: ${{homepage}}"),
-            fmt={"homepage": pkg.homepage},
-        ),
-    )
-    call_ktrigger(
-        IKernelTrigger.on_output,
-        message=fast_format_str(
-            _("License: ${{license}}"),
-            fmt={"license": pkg.pkg_license},
-        ),
-    )
-    call_ktrigger(
-        IKernelTrigger.on_output,
-        message=fast_format_str(
-            _("Tags: ${{tags}}"),
-            fmt={"tags": ", ".join(pkg.tags)},
-        ),
-    )
-    call_ktrigger(
-        IKernelTrigger.on_output,
-        message=fast_format_str(
-            _("Description: ${{desc}}"),
-            fmt={"desc": pkg.description},
-        ),
+        message="\n".join(fast_format_str(msg, fmt=fmt) for msg, fmt in fields),
     )
 
 
@@ -22,6 +22,7 @@
 from __future__ import annotations
 
 import sys
+import threading
 from typing import TYPE_CHECKING, Any, cast
 
 import colorama
@@ -109,19 +110,28 @@ class RubiscoKTrigger(  # pylint: disable=too-many-public-methods
 
     # Singleton pattern, but linter does not like it.
     cur_progress: rich.progress.Progress | None
+    _idle_progress: rich.progress.Progress | None
     tasks: dict[str, rich.progress.TaskID]
     task_types: dict[str, str]
     live: rich.live.Live | None
     _speedtest_hosts: dict[str, str]
+    _speedtest_testing: str
     _rich_printer: object
+    _progress_lock: threading.RLock
 
     def __init__(self) -> None:
         super().__init__()
+        # Progress tasks may be updated by parallel workers (e.g. parallel
+        # subpackage fetching).
+        self._progress_lock = threading.RLock()
         self.cur_progress = None
+        # The stopped progress bar is kept and restarted by the next task.
+        self._idle_progress = None
         self.tasks = {}
         self.task_types = {}
         self.live = None
         self._speedtest_hosts = {}
+        self._speedtest_testing = ""
         self._rich_printer = rich.print
 
     def _highlight_command(self, shell: Path, cmd: str) -> str:
@@ -173,43 +183,48 @@ class RubiscoKTrigger(  # pylint: disable=too-many-public-methods
         task_name: str,
         total: float | None,
     ) -> None:
-        output_step(task_start_msg)
-
-        if self.cur_progress is None:
-            self.cur_progress = rich.progress.Progress(
-                rich.progress.TextColumn(
-                    "[progress.description]{task.description}",
-                ),
-                rich.progress.BarColumn(),
-                CurrentProgressColumn(),
-                rich.progress.TaskProgressColumn(),
-                rich.progress.TimeElapsedColumn(),
-                rich.progress.TimeRemainingColumn(),
-                rich.progress.MofNCompleteColumn(),
+        with self._progress_lock:
+            output_step(task_start_msg)
+
+            if self.cur_progress is None:
+                progress = self._idle_progress
+                if progress is None:
+                    progress = rich.progress.Progress(
+                        rich.progress.TextColumn(
+                            "[progress.description]{task.description}",
+                        ),
+                        rich.progress.BarColumn(),
+                        CurrentProgressColumn(),
+                        rich.progress.TaskProgressColumn(),
+                        rich.progress.TimeElapsedColumn(),
+                        rich.progress.TimeRemainingColumn(),
+                        rich.progress.MofNCompleteColumn(),
+                    )
+                self._idle_progress = None
+                self.cur_progress = progress
+                progress.start()
+                rich.print = self._print_wrapper  # Evil hacking.
+            if task_name in self.tasks:
+                self.cur_progress.update(self.tasks[task_name], completed=0)
+            task_id = self.cur_progress.add_task(
+                task_name,
+                total=None if total == -1 else total,
             )
-            self.cur_progress.start()
-        if task_name in self.tasks:
-            self.cur_progress.update(self.tasks[task_name], completed=0)
-        task_id = self.cur_progress.add_task(
-            task_name,
-            total=None if total == -1 else total,
-        )
-        self.tasks[task_name] = task_id
-
-        def _print_wrapper(
-            *args: list[Any],
-            flush: bool = False,
-            **kwargs: dict[str, Any],
-        ) -> None:
-            if not self.cur_progress:
-                self._rich_printer(*args, **kwargs, flush=flush)  # type: ignore[arg-type]
-                return
+            self.tasks[task_name] = task_id
 
-            self.cur_progress.print(*args, **kwargs)  # type: ignore[arg-type]
-            if flush:
-                sys.stdout.buffer.flush()
+    def _print_wrapper(
+        self,
+        *args: list[Any],
+        flush: bool = False,
+        **kwargs: dict[str, Any],
+    ) -> None:
+        if not self.cur_progress:
+            self._rich_printer(*args, **kwargs, flush=flush)  # type: ignore[arg-type]
+            return
 
-        rich.print = _print_wrapper  # Evil hacking.
+        self.cur_progress.print(*args, **kwargs)  # type: ignore[arg-type]
+        if flush:
+            sys.stdout.buffer.flush()
 
     def on_progress(  # pylint: disable=R0913
         self,
@@ -220,41 +235,45 @@ class RubiscoKTrigger(  # pylint: disable=too-many-public-methods
         update_msg: str = "",
         status_msg: str = "",
     ) -> None:
-        output_line(update_msg)
+        with self._progress_lock:
+            output_line(update_msg)
 
-        if self.cur_progress is None:
-            logger.warning("Progress not started.")
-            return
-        if delta:
-            self.cur_progress.update(
-                self.tasks[task_name],
-                advance=current,
-                status=status_msg,
-            )
-        else:
-            self.cur_progress.update(
-                self.tasks[task_name],
-                completed=current,
-                status=status_msg,
-            )
+            if self.cur_progress is None:
+                logger.warning("Progress not started.")
+                return
+            if delta:
+                self.cur_progress.update(
+                    self.tasks[task_name],
+                    advance=current,
+                    status=status_msg,
+                )
+            else:
+                self.cur_progress.update(
+                    self.tasks[task_name],
+                    completed=current,
+                    status=status_msg,
+                )
 
     def set_progress_total(self, *, task_name: str, total: float) -> None:
-        if self.cur_progress is None:
-            logger.warning("Progress not started.")
-            return
-        self.cur_progress.update(self.tasks[task_name], total=total)
+        with self._progress_lock:
+            if self.cur_progress is None:
+                logger.warning("Progress not started.")
+                return
+            self.cur_progress.update(self.tasks[task_name], total=total)
 
     def on_finish_task(self, *, task_name: str) -> None:
-        if self.cur_progress is None:
-            logger.warning("Progress not started.")
-            return
-        self.cur_progress.remove_task(self.tasks[task_name])
-        del self.tasks[task_name]
-        if not self.tasks:
-            self.cur_progress.stop()
-            self.cur_progress = None
-            if self._rich_printer:
-                rich.print = self._rich_printer
+        with self._progress_lock:
+            if self.cur_progress is None:
+                logger.warning("Progress not started.")
+                return
+            self.cur_progress.remove_task(self.tasks[task_name])
+            del self.tasks[task_name]
+            if not self.tasks:
+                self.cur_progress.stop()
+                self._idle_progress = self.cur_progress
+                self.cur_progress = None
+                if self._rich_printer:
+                    rich.print = self._rich_printer
 
     def on_syspkg_installation_skip(
         self,
@@ -316,69 +335,74 @@ class RubiscoKTrigger(  # pylint: disable=too-many-public-methods
         if self.live is None:
             msg = "RubiscoKTrigger.live is None."
             raise ValueError(msg)
-        msg = ""
-        for host_, status in self._speedtest_hosts.items():
-            msg += (
-                sum_level_indent(-2)
-                + get_prompt(-2, ">", ">")
-                + " "
+        prefix = f"{sum_level_indent(-2)}{get_prompt(-2, '>', '>')} "
+        template = _("Testing ${{host}} ... ${{status}}")
+        self.live.update(
+            "".join(
+                prefix
                 + fast_format_str(
-                    _("Testing ${{host}} ... ${{status}}"),
+                    template,
                     fmt={"host": host_, "status": status},
                 )
                 + "\n"
-            )
-        self.live.update(msg)
+                for host_, status in self._speedtest_hosts.items()
+            ),
+        )
 
     def pre_speedtest(self, *, host: str) -> None:
-        conemu_progress(ProgressBarState.WAITING)
-        if self.live is None:
-            output_step(_("Performing websites speed test ..."))
-            self.live = rich.live.Live()
-            self.live.start()
-            self._speedtest_hosts.clear()
-        self._speedtest_hosts[host] = _("[yellow]Testing[/yellow] ...")
-        self._update_live()
+        # Speed tests of different websites may run at the same time. They
+        # share one live view.
+        with self._progress_lock:
+            conemu_progress(ProgressBarState.WAITING)
+            if self.live is None:
+                output_step(_("Performing websites speed test ..."))
+                self.live = rich.live.Live()
+                self.live.start()
+                self._speedtest_hosts.clear()
+                # Translate once per speed test. `post_speedtest` looks for this
+                # very object.
+                self._speedtest_testing = _("[yellow]Testing[/yellow] ...")
+            self._speedtest_hosts[host] = self._speedtest_testing
+            self._update_live()
 
     def post_speedtest(self, *, host: str, speed: int) -> None:
-        if self.live is None:
-            msg = "RubiscoKTrigger.live is None."
-            raise ValueError(msg)
-        if speed == -1:
-            self._speedtest_hosts[host] = _("[red]Canceled[/red]")
-        elif speed == C_INTMAX:
-            self._speedtest_hosts[host] = _("[red]Failed[/red]")
-        else:
-            self._speedtest_hosts[host] = fast_format_str(
-                _("${{speed}} us"),
-                fmt={"speed": str(speed)},
-            )
+        with self._progress_lock:
+            if self.live is None:
+                # Another speed test running at the same time closed the view.
+                return
+            if speed == -1:
+                self._speedtest_hosts[host] = _("[red]Canceled[/red]")
+            elif speed == C_INTMAX:
+                self._speedtest_hosts[host] = _("[red]Failed[/red]")
+            else:
+                self._speedtest_hosts[host] = fast_format_str(
+                    _("${{speed}} us"),
+                    fmt={"speed": str(speed)},
+                )
 
-        self._update_live()
+            self._update_live()
 
-        cant_stop = False
-        for status in self._speedtest_hosts.values():
-            cant_stop |= status == _(
-                "[yellow]Testing[/yellow] ...",
-            )
+            testing = self._speedtest_testing
+            if not any(
+                status is testing for status in self._speedtest_hosts.values()
+            ):
+                self.live.stop()
+                self.live = None
 
-        if not cant_stop:
+    def stop_speedtest(self, *, choise: str | None) -> None:
+        with self._progress_lock:
+            conemu_progress(ProgressBarState.NORMAL)
+            if self.live is None:
+                return
             self.live.stop()
             self.live = None
-
-    def stop_speedtest(self, *, choise: str | None) -> None:
-        conemu_progress(ProgressBarState.NORMAL)
-        if self.live is None:
-            return
-        self.live.stop()
-        self.live = None
-        if choise:
-            output_step(
-                fast_format_str(
-                    _("Selected mirror: ${{url}}"),
-                    fmt={"url": choise},
-                ),
-            )
+            if choise:
+                output_step(
+                    fast_format_str(
+                        _("Selected mirror: ${{url}}"),
+                        fmt={"url": choise},
+                    ),
+                )
 
     def pre_run_workflow_step(self, *, step: Step) -> None:
         if step.name.strip():
@@ -539,54 +563,44 @@ class RubiscoKTrigger(  # pylint: disable=too-many-public-methods
                 },
             ),
         )
-        rich.print(
-            fast_format_str(
+        if isinstance(project.maintainers, list):
+            maintainers = "\n  ".join([str(m) for m in project.maintainers])
+        else:
+            maintainers = str(project.maintainers)
+        _u = _("[yellow]Unknown[/yellow]")
+        fields = [
+            (
                 _("[dark_orange]Project:[/dark_orange] ${{name}}"),
-                fmt={"name": make_pretty(project.name)},
+                {"name": make_pretty(project.name)},
             ),
-        )
-        rich.print(
-            fast_format_str(
+            (
                 _("[dark_orange]Configuration:[/dark_orange] ${{path}}"),
-                fmt={"path": make_pretty(project.config.path)},
+                {"path": make_pretty(project.config.path)},
             ),
-        )
-        rich.print(
-            fast_format_str(
+            (
                 _(
                     "[dark_orange]Version:[/dark_orange]"
                     " v[white]${{version}}[/white]",
                 ),
-                fmt={"version": str(project.version)},
+                {"version": str(project.version)},
             ),
-        )
-
-        if isinstance(project.maintainers, list):
-            maintainers = "\n  ".join([str(m) for m in project.maintainers])
-        else:
-            maintainers = str(project.maintainers)
-        rich.print(
-            fast_format_str(
+            (
                 _("[dark_orange]Maintainers:[/dark_orange] ${{maintainers}}"),
-                fmt={"maintainers": maintainers},
+                {"maintainers": maintainers},
             ),
-        )
-        _u = _("[yellow]Unknown[/yellow]")
-        rich.print(
-            fast_format_str(
+            (
                 _("[dark_orange]License:[/dark_orange] ${{license}}"),
-                fmt={"license": project.license or _u},
+                {"license": project.license or _u},
             ),
-        )
-        rich.print(
-            fast_format_str(
+            (
                 _("[dark_orange]Description:[/dark_orange] ${{desc}}"),
-                fmt={"desc": project.description},
+                {"desc": project.description},
             ),
-        )
-
-        rich.print(_("[dark_orange]Hooks:[/dark_orange]"))
+        ]
+        lines = [fast_format_str(msg, fmt=fmt) for msg, fmt in fields]
+        lines.append(_("[dark_orange]Hooks:[/dark_orange]"))
 
+        hooks = get_hooks()
         for hook_name in project.hooks:  # Bind all hooks.
             hook_text = fast_format_str(
                 "\t[cyan]${{name}}[/cyan]",
@@ -594,10 +608,10 @@ class RubiscoKTrigger(  # pylint: disable=too-many-public-methods
             )
             num_text = fast_format_str(
                 _("(${{num}} hooks)"),
-                fmt={"num": str(len(get_hooks()[hook_name]))},
+                fmt={"num": str(len(hooks[hook_name]))},
             )
-            formatted_str = f"{hook_text:<60}\t{num_text:<10}"
-            rich.print(formatted_str)
+            lines.append(f"{hook_text:<60}\t{num_text:<10}")
+        rich.print("\n".join(lines))
 
     def on_mklink(
         self,
@@ -45,7 +45,7 @@ def clean_logfile() -> None:
                     f.seek(0)
                     f.truncate()
                     return
-    except:  # pylint: disable=bare-except  # noqa: E722
+    except (OSError, ValueError):
         logger.warning("Failed to clean log file.", exc_info=True)
 
     try:
@@ -57,5 +57,5 @@ def clean_logfile() -> None:
                     f.seek(0)
                     f.truncate()
                     return
-    except:  # pylint: disable=bare-except  # noqa: E722 S110
+    except (OSError, ValueError):
         pass  # Logging a log file exception?
@@ -28,16 +28,8 @@ from pathlib import Path
 
 import colorama
 
-from rubisco.cli.main.arg_parser import (
-    early_arg_parser,
-    get_arg_parser,
-    init_arg_parser,
-)
-from rubisco.cli.main.builtin_cmds import register_builtin_cmds
-from rubisco.cli.main.extman_cmds import register_extman_cmds
-from rubisco.cli.main.ktrigger import RubiscoKTrigger
 from rubisco.cli.main.log_cleaner import clean_logfile
-from rubisco.cli.main.project_config import load_project
+from rubisco.cli.main.version_action import show_version
 from rubisco.cli.output import output_step, set_available_color, show_exception
 from rubisco.config import (
     APP_VERSION,
@@ -47,10 +39,6 @@ from rubisco.lib.l10n import _
 from rubisco.lib.log import logger
 from rubisco.lib.variable import make_pretty
 from rubisco.lib.variable.fast_format_str import fast_format_str
-from rubisco.shared.extension import load_all_extensions
-from rubisco.shared.ktrigger import (
-    bind_ktrigger_interface,
-)
 
 __all__ = ["main"]
 
@@ -66,7 +54,11 @@ atexit.register(on_exit)
 
 def parse_early_arguments() -> None:
     """Parse early arguments."""
-    early_args = early_arg_parser.parse_known_args()[0]
+    from rubisco.cli.main.arg_parser import (  # pylint: disable=C0415 # noqa: PLC0415
+        get_early_arg_parser,
+    )
+
+    early_args = get_early_arg_parser().parse_known_args()[0]
 
     set_available_color(early_args.used_prompt_colors)
 
@@ -82,12 +74,69 @@ def parse_early_arguments() -> None:
         os.chdir(rootdir)
 
 
+# Options of '/' which take no value. They may appear before "-v".
+_EARLY_FLAGS = frozenset(("--log", "--debug", "--verbose"))
+
+
+def _is_version_only(argv: list[str]) -> bool:
+    """Check if the command line only asks for the version.
+
+    Flags in `_EARLY_FLAGS` before "-v" are skipped. Any other token ends
+    the scan, so "rubisco --root dir -v" still takes the full startup and
+    enters the directory first.
+
+    Args:
+        argv (list[str]): Command line arguments without the program name.
+
+    Returns:
+        bool: True if "-v" or "--version" comes before any other option.
+
+    """
+    for arg in argv:
+        if arg in ("-v", "--version"):
+            return True
+        if arg not in _EARLY_FLAGS:
+            return False
+    return False
+
+
 def main() -> None:
     """Rubisco main entry point."""
     try:
         clean_logfile()
         logger.info("Rubisco CLI version %s started.", str(APP_VERSION))
         colorama.init()
+        if _is_version_only(sys.argv[1:]):
+            # Same as the "--version" action, which would exit here anyway.
+            # Don't load extensions and the project only to show it.
+            show_version()
+            sys.exit(0)
+
+        # The kernel, the extensions and the UI are only imported to run a
+        # command. "rubisco -v" doesn't pay for them.
+        # pylint: disable=C0415
+        from rubisco.cli.main.arg_parser import (  # noqa: PLC0415
+            get_arg_parser,
+            init_arg_parser,
+        )
+        from rubisco.cli.main.builtin_cmds import (  # noqa: PLC0415
+            register_builtin_cmds,
+        )
+        from rubisco.cli.main.extman_cmds import (  # noqa: PLC0415
+            register_extman_cmds,
+        )
+        from rubisco.cli.main.ktrigger import RubiscoKTrigger  # noqa: PLC0415
+        from rubisco.cli.main.project_config import (  # noqa: PLC0415
+            load_project,
+        )
+        from rubisco.shared.extension import (  # noqa: PLC0415
+            load_all_extensions,
+        )
+        from rubisco.shared.ktrigger import (  # noqa: PLC0415
+            bind_ktrigger_interface,
+        )
+
+        # pylint: enable=C0415
         bind_ktrigger_interface("rubisco", RubiscoKTrigger())
         init_arg_parser()
         load_all_extensions()
@@ -77,7 +77,7 @@ def get_project_config() -> ProjectConfigration | None:
                 _(
                     "Working directory ${{path}} is not a Rubisco project.",
                 ),
-                fmt={"path": make_pretty(Path.cwd().absolute())},
+                fmt={"path": make_pretty(Path.cwd())},
             ),
         )
     return _project_config
@@ -137,8 +137,9 @@ def call_hook(name: str) -> None:
 def load_project() -> None:
     """Load the project in cwd."""
     global _project_config  # pylint: disable=global-statement # noqa: PLW0603
+    cwd = Path.cwd()  # Already absolute and normalized.
     try:
-        _project_config = load_project_config(Path.cwd())
+        _project_config = load_project_config(cwd)
         for hook_name in _project_config.hooks:  # Bind all hooks.
             bind_hook(hook_name)
     except RUNotRubiscoProjectError as exc:
@@ -147,7 +148,7 @@ def load_project() -> None:
                 _(
                     "Working directory ${{path}} is not a Rubisco project.",
                 ),
-                fmt={"path": make_pretty(Path.cwd().absolute())},
+                fmt={"path": make_pretty(cwd)},
             ),
             hint=fast_format_str(
                 _("${{path}} is not found."),
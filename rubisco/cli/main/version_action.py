@@ -19,16 +19,22 @@
 
 """Utils for showing the version of the CLI."""
 
+from __future__ import annotations
+
 import argparse
-from collections.abc import Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import rich
 
 from rubisco.config import APP_NAME, APP_VERSION
-from rubisco.kernel.command_event.args import Argument, Option
 from rubisco.lib.l10n import _
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    # The kernel is only needed for type hints. "rubisco -v" doesn't load it.
+    from rubisco.kernel.command_event.args import Argument, Option
+
 # ruff: noqa: D102 D107
 # pylint: disable=missing-function-docstring
 
@@ -41,6 +41,11 @@ class ProgressBarState(Enum):
     WARNING = 4
 
 
+# The last written state and percentage. Progress columns are rendered many
+# times per second, but the sequence only changes with the percentage.
+_last_progress: tuple[ProgressBarState, int] | None = None  # pylint: disable=C0103
+
+
 def conemu_progress(
     state: ProgressBarState,
     current_progress: float = 0,
@@ -54,9 +59,13 @@ def conemu_progress(
         total (float): Total value.
 
     """
+    global _last_progress  # pylint: disable=W0603 # noqa: PLW0603
     progress = current_progress / total * 100 if total else 50
     if state is ProgressBarState.DEFAULT:
         progress = 0
+    if _last_progress == (state, int(progress)):
+        return
+    _last_progress = (state, int(progress))
     msg = f"\x1b]9;4;{state.value};{int(progress)};\x07"
     sys.stdout.buffer.write(msg.encode(DEFAULT_CHARSET))
 
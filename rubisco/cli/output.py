@@ -174,15 +174,10 @@ def output_step(message: str, level: int = -1, end: str = "\n") -> None:
         indent = sum_level_indent(level)
         prompt = get_prompt(level)
 
+        # The template is not translated, so a f-string is enough. It doesn't
+        # push and pop variables for each step message.
         rich.print(
-            fast_format_str(
-                "${{indent}}[blue]${{prompt}}[/blue] [bold]${{msg}}[/bold]",
-                fmt={
-                    "indent": indent,
-                    "prompt": prompt,
-                    "msg": message,
-                },
-            ),
+            f"{indent}[blue]{prompt}[/blue] [bold]{message}[/bold]",
             end=end,
         )
 
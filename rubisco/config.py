@@ -39,7 +39,8 @@ DEFAULT_CHARSET = "UTF-8"
 
 # Miscellaneous configurations.
 TIMEOUT = 15
-COPY_BUFSIZE = 1024 * 1024 if os.name == "nt" else 64 * 1024
+# Larger blocks keep the per-call overhead of the (de)compressors low.
+COPY_BUFSIZE = 1024 * 1024 if os.name == "nt" else 128 * 1024
 
 # Extension configuration.
 VALID_EXTENSION_NAME = r"^[A-Za-z0-9_\-.]+$"
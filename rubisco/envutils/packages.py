@@ -96,11 +96,12 @@ class ExtensionPackageInfo:  # pylint: disable=too-many-instance-attributes
 
 
 def _pkg_check(zip_file: zipfile.ZipFile, pkg_name: str) -> None:
-    files = zip_file.namelist()
+    # Only the top-level names matter, parse each path once.
     root_list: set[str] = set()
-    for file in files:
-        if Path(file).parts:
-            root_list.add(str(Path(file).parts[0]))
+    for file in zip_file.namelist():
+        parts = Path(file).parts
+        if parts:
+            root_list.add(parts[0])
 
     try:
         root_list.remove(canonical_pkg_name(pkg_name))
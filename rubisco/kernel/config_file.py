@@ -21,14 +21,13 @@
 
 from pathlib import Path
 
-import json5 as json
-
 from rubisco.config import (
     DEFAULT_CHARSET,
     GLOBAL_CONFIG_FILE,
     USER_CONFIG_FILE,
     WORKSPACE_CONFIG_FILE,
 )
+from rubisco.kernel.config_loader import load_json
 from rubisco.lib.log import logger
 from rubisco.lib.variable import AutoFormatDict
 
@@ -43,7 +42,7 @@ def _load_json(file: Path, envname: str) -> None:
         logger.info("Loading global configuration %s ...", file)
         if file.exists():
             with file.open("r", encoding=DEFAULT_CHARSET) as f:
-                config_file.merge(AutoFormatDict(json.load(f)))
+                config_file.merge(AutoFormatDict(load_json(f)))
     except:  # pylint: disable=bare-except  # noqa: E722
         logger.warning(
             "Failed to load %s configuration: %s",
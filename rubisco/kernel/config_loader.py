@@ -19,7 +19,10 @@
 
 """Rubisco config file loader."""
 
+import json as std_json
 import tomllib
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -28,19 +31,56 @@ import yaml
 
 from rubisco.config import DEFAULT_CHARSET
 from rubisco.lib.exceptions import RUValueError
+from rubisco.lib.fileutil import walk_dir
 from rubisco.lib.l10n import _
 from rubisco.lib.log import logger
 from rubisco.lib.variable import AutoFormatDict
 from rubisco.lib.variable.fast_format_str import fast_format_str
 from rubisco.lib.variable.utils import make_pretty
 
-__all__ = ["SUPPORTED_EXTS", "RUConfiguration"]
+__all__ = ["SUPPORTED_EXTS", "RUConfiguration", "load_json"]
+
+
+def load_json(f: TextIO) -> Any:  # noqa: ANN401
+    """Load a JSON5 document from a text file.
+
+    Most files are plain JSON. The C parser of the standard library is much
+    faster than json5, so try it first.
+
+    Args:
+        f (TextIO): The file to read.
+
+    Returns:
+        Any: The loaded data.
+
+    Raises:
+        json5.JSON5DecodeError: If it's not a valid JSON5 document.
+
+    """
+    data = f.read()
+    try:
+        return std_json.loads(data)
+    except ValueError:
+        return json.loads(data)
 
 
 def _toml_loadfunc(f: TextIO) -> dict[str, Any]:
     return tomllib.loads(f.read())
 
 
+@lru_cache(maxsize=128)
+def _load_data(
+    path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+    loadfunc: Callable[[TextIO], Any],
+) -> Any:  # noqa: ANN401
+    # `mtime_ns` and `size` are only parts of the cache key. A changed file is
+    # parsed again. The result is shared, AutoFormatDict copies it before use.
+    with path.open(encoding=DEFAULT_CHARSET) as f:
+        return loadfunc(f)
+
+
 SUPPORTED_EXTS = {".json", ".json5", ".cfg", ".toml", ".ini", ".yml", ".yaml"}
 
 
@@ -49,12 +89,13 @@ class RUConfiguration(AutoFormatDict):
 
     path: Path
 
-    def __init__(self, path: Path, init: AutoFormatDict) -> None:
+    def __init__(self, path: Path, init: dict[str, Any]) -> None:
         """Initialize configuration.
 
         Args:
             path (Path): Config file path.
-            init (AutoFormatDict): Initial data.
+            init (dict[str, Any]): Initial data. It is converted to
+                AutoFormatDict, so a plain dict is enough.
 
         """
         super().__init__(init)
@@ -66,37 +107,38 @@ class RUConfiguration(AutoFormatDict):
         path: Path,
         loaded: list[Path],
     ) -> "RUConfiguration":
-        with path.open(encoding=DEFAULT_CHARSET) as f:
-            if path.suffix in {".json", ".json5"}:
-                loadfunc = json.load
-                filetype = "JSON5"
-            elif path.suffix in {".cfg", ".toml", ".ini"}:
-                loadfunc = _toml_loadfunc
-                filetype = "TOML"
-            elif path.suffix in {".yml", ".yaml"}:
-                loadfunc = yaml.safe_load
-                filetype = "YAML"
-            else:
-                raise RUValueError(
-                    fast_format_str(
-                        _("Unknown file type: ${{path}}"),
-                        fmt={
-                            "path": make_pretty(path),
-                        },
-                    ),
-                )
-
-            logger.debug("Loading config file as '%s': %s", filetype, path)
-            afd = RUConfiguration(path, AutoFormatDict(loadfunc(f)))
-            includes: list[str] = afd.get(
-                "includes",
-                default=[],
-                valtype=list[str],
+        if path.suffix in {".json", ".json5"}:
+            loadfunc = load_json
+            filetype = "JSON5"
+        elif path.suffix in {".cfg", ".toml", ".ini"}:
+            loadfunc = _toml_loadfunc
+            filetype = "TOML"
+        elif path.suffix in {".yml", ".yaml"}:
+            loadfunc = yaml.safe_load
+            filetype = "YAML"
+        else:
+            raise RUValueError(
+                fast_format_str(
+                    _("Unknown file type: ${{path}}"),
+                    fmt={
+                        "path": make_pretty(path),
+                    },
+                ),
             )
-            loaded.append(path)
-            for file in includes:
-                fp = path.parent / file
-                afd.merge(cls._load_from_file(fp, loaded))
+
+        logger.debug("Loading config file as '%s': %s", filetype, path)
+        stat = path.stat()
+        data = _load_data(path, stat.st_mtime_ns, stat.st_size, loadfunc)
+        afd = RUConfiguration(path, data)
+        includes: list[str] = afd.get(
+            "includes",
+            default=[],
+            valtype=list[str],
+        )
+        loaded.append(path)
+        for file in includes:
+            fp = path.parent / file
+            afd.merge(cls._load_from_file(fp, loaded))
 
         return afd
 
@@ -109,12 +151,12 @@ class RUConfiguration(AutoFormatDict):
         path = path.resolve()
         if path in loaded:
             logger.warning("Circular dependency detected: %s", path)
-            return RUConfiguration(path, AutoFormatDict({}))
+            return RUConfiguration(path, {})
         afd = cls.__load_from_file(path, loaded)
 
         dirpath = Path(str(path) + ".d")
         if dirpath.is_dir():
-            for file in dirpath.rglob("*"):
+            for file in walk_dir(dirpath):
                 if file.is_file():
                     afd.merge(cls.__load_from_file(file, loaded))
 
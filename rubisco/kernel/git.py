@@ -19,6 +19,8 @@
 
 """Mirrorlist for extension installer."""
 
+import threading
+from functools import partial
 from pathlib import Path
 
 from git.exc import GitError
@@ -71,11 +73,13 @@ def _gitpython_progress_update(
     cur_count: str | float,
     max_count: str | float | None,
     message: str,  # noqa: ARG001 # pylint: disable=W0613
+    *,
+    task_prefix: str,
 ) -> None:
     if isinstance(cur_count, str) or isinstance(max_count, str):
         return
 
-    msg = _gitpython_progress_update_opname(op_code)
+    msg = task_prefix + _gitpython_progress_update_opname(op_code)
 
     if op_code & RemoteProgress.BEGIN:
         call_ktrigger(
@@ -241,12 +245,21 @@ def git_clone(  # pylint: disable=R0913, R0917 # noqa: PLR0913
         path=path,
         branch=branch,
     )
+    # Clones in worker threads may run at the same time. They must not share
+    # progress task names, so prefix the repository name there.
+    if threading.current_thread() is threading.main_thread():
+        task_prefix = ""
+    else:
+        task_prefix = f"{path.name}: "
     try:
         repo = Repo.clone_from(
             url,
             path,
             branch=branch,
-            progress=_gitpython_progress_update,
+            progress=partial(
+                _gitpython_progress_update,
+                task_prefix=task_prefix,
+            ),
             multi_options=["--depth=1"] if shallow else [],
         )
     except GitError as exc:
@@ -281,15 +294,15 @@ def git_has_remote(path: Path, remote: str) -> bool:
         bool: True if the remote repository exists.
 
     """
-    _stdout, _stderr, retcode = Process(
-        ["git", "remote", "get-url", remote],
-        cwd=path,
-    ).popen(
-        stdout=False,
-        stderr=0,
-        fail_on_error=False,
-    )
-    return retcode == 0
+    # Read the remotes from the repository config in process instead of
+    # spawning `git remote get-url`. Like git, search the parent directories
+    # if the path is inside a work tree.
+    try:
+        repo = Repo(path, search_parent_directories=True)
+    except GitError:
+        return False
+    with repo:
+        return remote in repo.remotes
 
 
 def git_get_remote(path: Path, remote: str = "origin") -> str:
@@ -25,7 +25,9 @@ e.g:
 
 import asyncio
 import re
+import threading
 
+import aiohttp
 import beartype
 import json5 as json
 from urllib3.util import parse_url
@@ -39,7 +41,7 @@ from rubisco.kernel.config_loader import RUConfiguration
 from rubisco.lib.exceptions import RUValueError
 from rubisco.lib.l10n import _
 from rubisco.lib.log import logger
-from rubisco.lib.speedtest import C_INTMAX, url_speedtest
+from rubisco.lib.speedtest import C_INTMAX, speedtest_session, url_speedtest
 from rubisco.lib.variable import AutoFormatDict
 from rubisco.lib.variable.fast_format_str import fast_format_str
 from rubisco.shared.ktrigger import IKernelTrigger, call_ktrigger
@@ -52,6 +54,13 @@ GLOBAL_MIRRORLIST_FILE = RUBISCO_GLOBAL_CONFIG_DIR / "mirrorlist.json"
 
 mirrorlist = AutoFormatDict()
 
+# Speedtest result of each website. Tested once per process. Each website has
+# its own lock, so parallel fetches only wait for a speedtest of the website
+# they need. `_website_locks_lock` only guards the creation of these locks.
+_fastest_mirrors: dict[str, str] = {}
+_website_locks: dict[str, threading.Lock] = {}
+_website_locks_lock = threading.Lock()
+
 for mirrorlist_file in [
     GLOBAL_MIRRORLIST_FILE,
     USER_MIRRORLIST_FILE,
@@ -95,12 +104,13 @@ async def _speedtest(
     future: asyncio.Future[str | None],
     mirror: str,
     url: str,
+    session: aiohttp.ClientSession,
 ) -> None:
     try:
         parsed_url = parse_url(url)
         url = f"{parsed_url.scheme}://{parsed_url.host}"  # Host only.
         call_ktrigger(IKernelTrigger.pre_speedtest, host=url)
-        speed = await url_speedtest(url)
+        speed = await url_speedtest(url, session)
         if future.done():
             return
         call_ktrigger(IKernelTrigger.post_speedtest, host=url, speed=speed)
@@ -125,33 +135,25 @@ def get_mirrorlist(
         AutoFormatDict: The mirrorlist.
 
     """
-    host = host.lower()
-
-    mlist1 = mirrorlist.get(
-        host,
-        valtype=dict | str,
-    )
-    if isinstance(mlist1, str):  # Alias support.
-        mlist1 = mirrorlist.get(
-            mlist1,
-            valtype=dict | str,
-        )
-    if isinstance(mlist1, str):
-        try:
-            return get_mirrorlist(mlist1, protocol)
-        # If someone see this code, please remind me to refactor it.
-        except RecursionError as exc:  # The easiest way to detect recursion :)
+    name = host.lower()
+    visited = {name}
+    mlist = mirrorlist.get(name, valtype=dict | str)
+    while isinstance(mlist, str):  # Alias support.
+        name = mlist.lower()
+        if name in visited:
             raise RUValueError(
                 fast_format_str(
                     _("Recursion detected in mirrorlist: '${{name}}'"),
-                    fmt={"name": mlist1},
+                    fmt={"name": name},
                 ),
                 hint=_(
                     "Please check your [underline]mirrorlist.json[/underline]"
                     " file in workspace, user or global config directory.",
                 ),
-            ) from exc
-    return mlist1.get(protocol, valtype=dict)
+            )
+        visited.add(name)
+        mlist = mirrorlist.get(name, valtype=dict | str)
+    return mlist.get(protocol, valtype=dict)
 
 
 async def find_fastest_mirror(
@@ -171,22 +173,25 @@ async def find_fastest_mirror(
     """
     try:
         mlist: AutoFormatDict = get_mirrorlist(host, protocol)
-        future = asyncio.get_event_loop().create_future()
-        tasks: list[asyncio.Task[None]] = []
-        for mirror, murl in mlist.orig_items():
-            task = asyncio.ensure_future(_speedtest(future, mirror, murl))
-            tasks.append(task)
-        daemon = asyncio.ensure_future(_speedtest_daemon(future, tasks))
-        # Waiting for fastest mirror (future result is set).
-        try:
-            await future
-            daemon.cancel("Fastest mirror found.")
-            fastest: str | None = future.result()
-        except asyncio.exceptions.CancelledError:
-            fastest = None
-        for task in tasks:
-            task.cancel("Fastest mirror found.")
-        await asyncio.gather(*tasks)  # Wait for all tasks to finish.
+        async with speedtest_session() as session:
+            future = asyncio.get_event_loop().create_future()
+            tasks: list[asyncio.Task[None]] = []
+            for mirror, murl in mlist.orig_items():
+                task = asyncio.ensure_future(
+                    _speedtest(future, mirror, murl, session),
+                )
+                tasks.append(task)
+            daemon = asyncio.ensure_future(_speedtest_daemon(future, tasks))
+            # Waiting for fastest mirror (future result is set).
+            try:
+                await future
+                daemon.cancel("Fastest mirror found.")
+                fastest: str | None = future.result()
+            except asyncio.exceptions.CancelledError:
+                fastest = None
+            for task in tasks:
+                task.cancel("Fastest mirror found.")
+            await asyncio.gather(*tasks)  # Wait for all tasks to finish.
 
         call_ktrigger(IKernelTrigger.stop_speedtest, choise=fastest)
         if fastest is None:
@@ -214,6 +219,19 @@ async def find_fastest_mirror(
         return "official"
 
 
+def _get_fastest_mirror(website: str) -> str:
+    with _website_locks_lock:
+        lock = _website_locks.setdefault(website, threading.Lock())
+    with lock:
+        mirror = _fastest_mirrors.get(website)
+        if mirror is None:
+            mirror = asyncio.run(find_fastest_mirror(website))
+            _fastest_mirrors[website] = mirror
+        else:
+            logger.info("Using tested mirror for '%s': %s", website, mirror)
+        return mirror
+
+
 @beartype.beartype
 def get_url(
     remote: str,
@@ -242,7 +260,7 @@ def get_url(
         user, repo, website = matched.groups()
         if use_fastest and protocol == "http":
             # Only support HTTP(s) speedtest now.
-            mirror = asyncio.run(find_fastest_mirror(website))
+            mirror = _get_fastest_mirror(website)
         else:
             mirror = "official"
         try:
@@ -72,7 +72,7 @@ class ProjectConfigration:  # pylint: disable=too-many-instance-attributes
 
     def __init__(self, config_file: Path) -> None:
         """Initialize the project configuration."""
-        self.config = RUConfiguration(config_file, AutoFormatDict())
+        self.config = RUConfiguration(config_file, {})
         self.hooks = AutoFormatDict()
         self.pushed_variables = []
 
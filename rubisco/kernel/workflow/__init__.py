@@ -27,10 +27,10 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-import json5 as json
 import yaml
 
 from rubisco.config import DEFAULT_CHARSET
+from rubisco.kernel.config_loader import load_json
 from rubisco.kernel.workflow._interfaces import WorkflowInterfaces
 from rubisco.kernel.workflow.steps import step_contributes, step_types
 from rubisco.kernel.workflow.workflow import Workflow
@@ -149,7 +149,7 @@ def run_workflow(
     try:
         with file.open(encoding=DEFAULT_CHARSET) as f:
             if file.suffix.lower() in [".json", ".json5"]:
-                workflow = json.load(f)
+                workflow = load_json(f)
             elif file.suffix.lower() in [".yaml", ".yml"]:
                 workflow = yaml.safe_load(f)
             else:
@@ -76,10 +76,11 @@ class CopyFileStep(Step):
 
     def run(self) -> None:
         """Run the step."""
-        if self.overwrite and self.dst.exists() and not self.dst.is_dir():
-            rm_recursive(self.dst, strict=True)
         if self.dst.exists() and not self.dst.is_dir():
-            check_file_exists(self.dst)
+            if self.overwrite:
+                rm_recursive(self.dst, strict=True)
+            else:
+                check_file_exists(self.dst)
         assert_rel_path(self.dst)
 
         matched: bool = False
@@ -23,7 +23,7 @@ from pathlib import Path
 
 from rubisco.kernel.workflow.step import Step
 from rubisco.lib.process import Process
-from rubisco.lib.variable.variable import push_variables
+from rubisco.lib.variable.variable import push_variables_bulk
 
 __all__ = ["PopenStep"]
 
@@ -64,6 +64,10 @@ class PopenStep(Step):
             fail_on_error=self.fail_on_error,
             show_step=True,
         )
-        push_variables(f"{self.global_id}.stdout", stdout)
-        push_variables(f"{self.global_id}.stderr", stderr)
-        push_variables(f"{self.global_id}.retcode", retcode)
+        push_variables_bulk(
+            {
+                f"{self.global_id}.stdout": stdout,
+                f"{self.global_id}.stderr": stderr,
+                f"{self.global_id}.retcode": retcode,
+            },
+        )
@@ -29,7 +29,10 @@ from rubisco.lib.l10n import _
 from rubisco.lib.variable.autoformatdict import AutoFormatDict
 from rubisco.lib.variable.fast_format_str import fast_format_str
 from rubisco.lib.variable.utils import make_pretty
-from rubisco.lib.variable.variable import pop_variables, push_variables
+from rubisco.lib.variable.variable import (
+    pop_variables_bulk,
+    push_variables_bulk,
+)
 from rubisco.shared.ktrigger import IKernelTrigger, call_ktrigger
 
 __all__ = ["Workflow"]
@@ -55,10 +58,9 @@ class Workflow:
         """
         self.pushed_variables = []
         pairs = data.get("vars", {}, valtype=dict[str, Any])
-
-        for key, val in pairs.items():
-            self.pushed_variables.append(str(key))
-            push_variables(str(key), val)
+        values = {str(key): val for key, val in pairs.items()}
+        self.pushed_variables = list(values)
+        push_variables_bulk(values)
 
         self.id = data.get(
             "id",
@@ -217,5 +219,4 @@ class Workflow:
 
     def __del__(self) -> None:
         """Pop variables."""
-        for name in self.pushed_variables:
-            pop_variables(name)
+        pop_variables_bulk(self.pushed_variables)
@@ -28,6 +28,7 @@ import os
 import tarfile
 import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import py7zr
 import py7zr.exceptions
@@ -40,6 +41,7 @@ from rubisco.lib.exceptions import RUValueError
 from rubisco.lib.fileutil import (
     assert_rel_path,
     check_file_exists,
+    open_sequential,
     rm_recursive,
 )
 from rubisco.lib.l10n import _
@@ -48,6 +50,9 @@ from rubisco.lib.variable.fast_format_str import fast_format_str
 from rubisco.lib.variable.utils import make_pretty
 from rubisco.shared.ktrigger import IKernelTrigger, call_ktrigger
 
+if TYPE_CHECKING:
+    from io import BufferedIOBase, BufferedReader
+
 __all__ = ["compress", "extract"]
 
 
@@ -58,7 +63,34 @@ class UnsupportedArchiveTypeError(AssertionError):
     """
 
 
-def extract_file(  # pylint: disable=too-many-branches # noqa: C901 PLR0912
+def _open_decompressor(
+    raw: BufferedReader,
+    compress_type: str,
+) -> BufferedIOBase:
+    if compress_type == "gz":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if compress_type == "bz2":
+        return bz2.BZ2File(raw, "rb")
+    if compress_type == "xz":
+        return lzma.LZMAFile(raw, "rb")
+    raise UnsupportedArchiveTypeError
+
+
+def _open_compressor(
+    dest: Path,
+    compress_type: str,
+    compress_level: int,
+) -> BufferedIOBase:
+    if compress_type == "gz":
+        return gzip.GzipFile(dest, "wb", compresslevel=compress_level)
+    if compress_type == "bz2":
+        return bz2.BZ2File(dest, "wb", compresslevel=compress_level)
+    if compress_type == "xz":
+        return lzma.LZMAFile(dest, "wb")
+    raise UnsupportedArchiveTypeError
+
+
+def extract_file(
     file: Path,
     dest: Path,
     compress_type: str = "gz",
@@ -88,19 +120,13 @@ def extract_file(  # pylint: disable=too-many-branches # noqa: C901 PLR0912
     if compress_type not in ["gz", "bz2", "xz"]:
         raise UnsupportedArchiveTypeError
 
-    if compress_type == "gz":
-        fsrc = gzip.open(file, "rb")  # noqa: SIM115
-    elif compress_type == "bz2":
-        fsrc = bz2.BZ2File(file, "rb")
-    elif compress_type == "xz":
-        fsrc = lzma.open(file, "rb")  # noqa: SIM115
-    else:
-        raise UnsupportedArchiveTypeError
-
-    with fsrc:
-        fsrc.seek(0, os.SEEK_END)
-        fsize = fsrc.tell()
-        fsrc.seek(0, os.SEEK_SET)
+    # Decompress in one pass. The progress follows the compressed bytes read,
+    # so the data is not decompressed once more only to get its size.
+    fsize = file.stat().st_size
+    with (
+        open_sequential(file) as raw,
+        _open_decompressor(raw, compress_type) as fsrc,
+    ):
         if not overwrite:
             check_file_exists(dest)
         elif dest.exists():
@@ -125,13 +151,12 @@ def extract_file(  # pylint: disable=too-many-branches # noqa: C901 PLR0912
                     total=fsize,
                 )
                 while buf := fsrc.read(COPY_BUFSIZE):
+                    fdst.write(buf)
                     call_ktrigger(
                         IKernelTrigger.on_progress,
                         task_name=task_name,
-                        current=len(buf),
-                        delta=True,
+                        current=float(raw.tell()),
                     )
-                    fdst.write(buf)
                 call_ktrigger(
                     IKernelTrigger.on_finish_task,
                     task_name=task_name,
@@ -276,7 +301,7 @@ def extract(  # pylint: disable=R0913 # noqa: PLR0913
         ) from exc
 
 
-def compress_file(  # pylint: disable=R0912 # noqa: C901 PLR0912
+def compress_file(
     src: Path,
     dest: Path,
     compress_type: str = "gz",
@@ -313,53 +338,48 @@ def compress_file(  # pylint: disable=R0912 # noqa: C901 PLR0912
     if compress_level is None:
         compress_level = 9
 
-    if compress_type == "gz":
-        fsrc = gzip.open(src, "rb", compresslevel=compress_level)  # noqa: SIM115
-    elif compress_type == "bz2":
-        fsrc = bz2.BZ2File(src, "rb", compresslevel=compress_level)
-    elif compress_type == "xz":
-        fsrc = lzma.open(src, "rb")  # noqa: SIM115
-    else:
-        raise UnsupportedArchiveTypeError
-
-    with fsrc:
-        fsrc.seek(0, os.SEEK_END)
-        fsize = fsrc.tell()
-        fsrc.seek(0, os.SEEK_SET)
-        with dest.open("wb") as fdst:
-            if fsize > COPY_BUFSIZE * 50:
-                task_start_msg = fast_format_str(
-                    _(
-                        "Compressing ${{path}} to ${{file}} as '${{type}}' ...",
-                    ),
-                    fmt={
-                        "path": make_pretty(src),
-                        "file": make_pretty(dest),
-                        "type": compress_type,
-                    },
-                )
-                task_name = _("Compressing")
-                call_ktrigger(
-                    IKernelTrigger.on_new_task,
-                    task_start_msg=task_start_msg,
-                    task_name=task_name,
-                    total=fsize,
-                )
-                while buf := fsrc.read(COPY_BUFSIZE):
-                    call_ktrigger(
-                        IKernelTrigger.on_progress,
-                        task_name=task_name,
-                        current=len(buf),
-                        delta=True,
-                    )
-                    fdst.write(buf)
+    # Compress the source file as it is, not as a compressed stream. The size
+    # comes from `stat`, and one buffer is reused for all the blocks.
+    fsize = src.stat().st_size
+    buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
+    with (
+        open_sequential(src) as fsrc,
+        _open_compressor(dest, compress_type, compress_level) as fdst,
+    ):
+        if fsize > COPY_BUFSIZE * 50:
+            task_start_msg = fast_format_str(
+                _(
+                    "Compressing ${{path}} to ${{file}} as '${{type}}' ...",
+                ),
+                fmt={
+                    "path": make_pretty(src),
+                    "file": make_pretty(dest),
+                    "type": compress_type,
+                },
+            )
+            task_name = _("Compressing")
+            call_ktrigger(
+                IKernelTrigger.on_new_task,
+                task_start_msg=task_start_msg,
+                task_name=task_name,
+                total=fsize,
+            )
+            while size := fsrc.readinto(buf):
+                fdst.write(view[:size])
                 call_ktrigger(
-                    IKernelTrigger.on_finish_task,
+                    IKernelTrigger.on_progress,
                     task_name=task_name,
+                    current=size,
+                    delta=True,
                 )
-            else:
-                while buf := fsrc.read(COPY_BUFSIZE):
-                    fdst.write(buf)
+            call_ktrigger(
+                IKernelTrigger.on_finish_task,
+                task_name=task_name,
+            )
+        else:
+            while size := fsrc.readinto(buf):
+                fdst.write(view[:size])
 
 
 def _compress(  # pylint: disable=R0913, R0917 # noqa: PLR0913
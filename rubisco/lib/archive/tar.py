@@ -25,7 +25,11 @@ from typing import Literal, cast
 
 from rubisco.kernel.config_file import config_file
 from rubisco.lib.archive.utils import get_includes, write_to_archive
-from rubisco.lib.fileutil import check_file_exists, rm_recursive
+from rubisco.lib.fileutil import (
+    check_file_exists,
+    open_sequential,
+    rm_recursive,
+)
 from rubisco.lib.l10n import _
 from rubisco.lib.variable.fast_format_str import fast_format_str
 from rubisco.lib.variable.utils import make_pretty
@@ -58,22 +62,27 @@ def extract_tarball(
     """
     compress_type = compress_type.lower().strip() if compress_type else None
     if compress_type in {"gzip", "gz"}:
-        compress_type_ = "r:gz"
+        compress_type_ = "r|gz"
     elif compress_type in {"bzip2", "bz2"}:
-        compress_type_ = "r:bz2"
+        compress_type_ = "r|bz2"
     elif compress_type == "xz":
-        compress_type_ = "r:xz"
+        compress_type_ = "r|xz"
     elif compress_type is None:
-        compress_type_ = "r"
+        compress_type_ = "r|"
     else:
         raise AssertionError
 
-    with tarfile.open(
-        tarball,
-        compress_type_,
-    ) as fp:
+    # Extract in stream mode. The members are extracted while the archive is
+    # decompressed, instead of decompressing it once to list the members and
+    # again to extract them. The progress follows the compressed bytes read.
+    with (
+        open_sequential(tarball) as raw,
+        tarfile.open(
+            fileobj=raw,
+            mode=compress_type_,
+        ) as fp,
+    ):
         fp: tarfile.TarFile
-        memembers = fp.getmembers()
         if not overwrite:
             check_file_exists(dest)
         elif dest.exists():
@@ -94,17 +103,16 @@ def extract_tarball(
             IKernelTrigger.on_new_task,
             task_start_msg=task_start_msg,
             task_name=task_name,
-            total=float(len(memembers)),
+            total=float(tarball.stat().st_size),
         )
 
         verbose = config_file.get("verbose", False, valtype=bool)
-        for member in memembers:
+        for member in fp:
             fp.extract(member, dest, filter=tarfile.tar_filter)
             call_ktrigger(
                 IKernelTrigger.on_progress,
                 task_name=task_name,
-                current=1.0,
-                delta=True,
+                current=float(raw.tell()),
                 update_msg=make_pretty(dest / member.path) if verbose else "",
             )
 
@@ -25,6 +25,7 @@ from pathlib import Path
 
 from rubisco.kernel.config_file import config_file
 from rubisco.lib.exceptions import RUValueError
+from rubisco.lib.fileutil import walk_dir
 from rubisco.lib.l10n import _
 from rubisco.lib.variable.fast_format_str import fast_format_str
 from rubisco.lib.variable.utils import make_pretty
@@ -48,7 +49,7 @@ def get_includes(
         list[Path]: Included files list.
 
     """
-    _includes = src.rglob("*") if src.is_dir() else [src]
+    _includes = walk_dir(src) if src.is_dir() else [src]
     includes: list[Path] = []
     for path in _includes:
         if excludes and any(path.match(ex) for ex in excludes):
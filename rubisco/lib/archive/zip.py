@@ -22,6 +22,7 @@
 import os
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rubisco.config import DEFAULT_CHARSET
@@ -38,6 +39,40 @@ from rubisco.shared.ktrigger import IKernelTrigger, call_ktrigger
 __all__ = ["compress_zip", "extract_zip"]
 
 
+def _extract_members(  # pylint: disable=R0913 # noqa: PLR0913
+    file: Path,
+    members: list[zipfile.ZipInfo],
+    dest: Path,
+    pwd: bytes | None,
+    task_name: str,
+    *,
+    verbose: bool,
+) -> None:
+    # ZipFile can't read several members at the same time, so every worker
+    # opens the archive itself.
+    with zipfile.ZipFile(file, "r") as fp:
+        for member in members:
+            try:
+                fp.extract(member, dest, pwd=pwd)
+            except FileExistsError:
+                # Another worker created the same directory at the same time.
+                fp.extract(member, dest, pwd=pwd)
+            perm = member.external_attr >> 16
+            if perm:
+                (dest / member.filename).chmod(perm)
+            utime = member.date_time
+            utime = time.mktime((*utime, 0, 0, -1))
+            os.utime(dest / member.filename, (utime, utime))
+            update_msg = make_pretty(dest / member.filename) if verbose else ""
+            call_ktrigger(
+                IKernelTrigger.on_progress,
+                task_name=task_name,
+                current=1,
+                delta=True,
+                update_msg=update_msg,
+            )
+
+
 def extract_zip(
     file: Path,
     dest: Path,
@@ -47,6 +82,9 @@ def extract_zip(
 ) -> None:
     """Extract zip file to destination.
 
+    Members are extracted by a thread pool. Zip members are compressed
+    separately, so they can be decompressed in parallel.
+
     Args:
         file (Path): Path to zip file.
         dest (Path): Destination directory.
@@ -56,52 +94,50 @@ def extract_zip(
     """
     with zipfile.ZipFile(file, "r") as fp:
         memembers = fp.infolist()
-        if not overwrite:
-            # Check if destination directory exists.
-            check_file_exists(dest)
-        elif dest.exists():
-            rm_recursive(dest)
-        test_msg = fast_format_str(
-            _(
-                "Extracting ${{file}} to ${{path}} as '${{type}}' ...",
-            ),
-            fmt={
-                "file": make_pretty(file),
-                "path": make_pretty(dest),
-                "type": "zip",
-            },
-        )
-        task_name = _("Extracting")
-        call_ktrigger(
-            IKernelTrigger.on_new_task,
-            task_start_msg=test_msg,
-            task_name=task_name,
-            total=len(memembers),
-        )
+    if not overwrite:
+        # Check if destination directory exists.
+        check_file_exists(dest)
+    elif dest.exists():
+        rm_recursive(dest)
+    test_msg = fast_format_str(
+        _(
+            "Extracting ${{file}} to ${{path}} as '${{type}}' ...",
+        ),
+        fmt={
+            "file": make_pretty(file),
+            "path": make_pretty(dest),
+            "type": "zip",
+        },
+    )
+    task_name = _("Extracting")
+    call_ktrigger(
+        IKernelTrigger.on_new_task,
+        task_start_msg=test_msg,
+        task_name=task_name,
+        total=len(memembers),
+    )
 
-        verbose = config_file.get("verbose", False, valtype=bool)
-        for member in memembers:
-            fp.extract(
-                member,
+    verbose = config_file.get("verbose", False, valtype=bool)
+    pwd = password.encode(DEFAULT_CHARSET) if password else None
+    # The same number of workers as ThreadPoolExecutor's default.
+    jobs = min(32, (os.cpu_count() or 1) + 4, len(memembers)) or 1
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                _extract_members,
+                file,
+                memembers[i::jobs],
                 dest,
-                pwd=password.encode(DEFAULT_CHARSET) if password else None,
-            )
-            perm = member.external_attr >> 16
-            if perm:
-                (dest / member.filename).chmod(perm)
-            utime = member.date_time
-            utime = time.mktime((*utime, 0, 0, -1))
-            os.utime(dest / member.filename, (utime, utime))
-            update_msg = make_pretty(dest / member.filename) if verbose else ""
-            call_ktrigger(
-                IKernelTrigger.on_progress,
-                task_name=task_name,
-                current=1,
-                delta=True,
-                update_msg=update_msg,
+                pwd,
+                task_name,
+                verbose=verbose,
             )
+            for i in range(jobs)
+        ]
+        for future in futures:
+            future.result()
 
-        call_ktrigger(IKernelTrigger.on_finish_task, task_name=task_name)
+    call_ktrigger(IKernelTrigger.on_finish_task, task_name=task_name)
 
 
 def compress_zip(  # pylint: disable=R0913, R0917 # noqa: PLR0913
@@ -46,15 +46,14 @@ def command(args: Iterable[Any] | str) -> str:
         return args
     args = expand_cmdlist(args)
 
-    res_command = ""
+    parts: list[str] = []
     for arg in args:
         if " " in arg:
-            if '"' in arg:
-                arg = arg.replace('"', '\\"')  # noqa: PLW2901
-            res_command += f'"{arg}" '
+            escaped = arg.replace('"', '\\"')
+            parts.append(f'"{escaped}"')
         else:
-            res_command += f"{arg} "
-    return res_command.strip()
+            parts.append(arg)
+    return " ".join(parts).strip()
 
 
 def expand_cmdlist(args: Iterable[str | Iterable[Any]]) -> list[str]:
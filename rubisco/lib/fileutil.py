@@ -22,6 +22,7 @@
 from __future__ import annotations
 
 import atexit
+import contextlib
 import fnmatch
 import os
 import shutil
@@ -30,7 +31,7 @@ import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
-from rubisco.config import APP_NAME
+from rubisco.config import APP_NAME, COPY_BUFSIZE
 from rubisco.lib.exceptions import (
     RUOSError,
     RUShellExecutionError,
@@ -43,7 +44,8 @@ from rubisco.lib.variable.utils import make_pretty
 from rubisco.shared.ktrigger import IKernelTrigger, call_ktrigger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from io import BufferedReader
     from types import FunctionType, TracebackType
 
 __all__ = [
@@ -53,8 +55,10 @@ __all__ = [
     "find_command",
     "glob_path",
     "human_readable_size",
+    "open_sequential",
     "resolve_path",
     "rm_recursive",
+    "walk_dir",
 ]
 
 
@@ -238,7 +242,7 @@ def copy_recursive(  # pylint: disable=R0913, R0917 # noqa: PLR0913
         else:
             if dst.is_dir():
                 dst = dst / src.name
-            if dst.exists() and not exists_ok:
+            if not exists_ok and dst.exists():
                 raise FileExistsError(
                     fast_format_str(
                         _(
@@ -466,6 +470,8 @@ class TemporaryObject:
             return
         if self.__fd:
             os.close(self.__fd)
+        # Check the path again. A path registered before it existed is
+        # recorded as a file, but it may have become a directory since.
         if self.path.is_file():
             self.path.unlink()
         else:
@@ -566,14 +572,15 @@ class TemporaryObject:
                     raise RUValueError(msg)
                 return cls(cls.TYPE_FILE, path)
             case cls.TYPE_DIRECTORY:
-                if not path.exists():
+                try:
+                    # Raises FileExistsError only if it is not a directory.
                     path.mkdir(parents=True, exist_ok=True)
-                elif not path.is_dir():
+                except FileExistsError as exc:
                     msg = fast_format_str(
                         _("Invalid type: ${{path}}, expected directory."),
                         fmt={"path": make_pretty(path)},
                     )
-                    raise RUValueError(msg)
+                    raise RUValueError(msg) from exc
                 return cls(cls.TYPE_DIRECTORY, path)
             case _:
                 msg = "Invalid path type."
@@ -631,6 +638,52 @@ def glob_path(
     return list(path.glob("*"))
 
 
+def walk_dir(path: Path) -> Iterator[Path]:
+    """Iterate all files and directories under a directory recursively.
+
+    Symlinks to directories are yielded but not followed. It uses
+    `os.scandir` so the file type comes from the directory listing instead
+    of one `stat` for each entry.
+
+    Args:
+        path (Path): The directory to walk.
+
+    Yields:
+        Path: The path of each file or directory.
+
+    """
+    # Walk with an explicit stack. Deep trees don't hit the recursion limit
+    # and don't pay a generator frame for each level.
+    dirs = [path]
+    while dirs:
+        with os.scandir(dirs.pop()) as it:
+            for entry in it:
+                entry_path = Path(entry.path)
+                yield entry_path
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry_path)
+
+
+def open_sequential(path: Path) -> BufferedReader:
+    """Open a file for reading it once from the beginning to the end.
+
+    The file is opened with a larger buffer, and the kernel is told that it
+    will be read sequentially, so it reads ahead more aggressively.
+
+    Args:
+        path (Path): The file to open.
+
+    Returns:
+        BufferedReader: The opened binary file.
+
+    """
+    file = path.open("rb", buffering=COPY_BUFSIZE)
+    # Not available on Windows and macOS.
+    with contextlib.suppress(AttributeError, OSError):
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return file
+
+
 def human_readable_size(size: float) -> str:
     """Convert size to human readable format.
 
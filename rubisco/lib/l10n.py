@@ -25,6 +25,7 @@ import gettext
 import locale
 import os
 import sys
+from functools import cache
 from pathlib import Path
 
 from rubisco.config import TEXT_DOMAIN
@@ -46,9 +47,13 @@ def _locale_language(category: int) -> str | None:
         return None
 
 
+@cache
 def locale_language() -> str:
     """Get locale language.
 
+    The locale is set once when this module is loaded, so the result is
+    cached. Every gettext domain lookup needs it.
+
     Returns:
         str: Locale language.
 
@@ -98,12 +103,16 @@ def has_domain(domain: str, locale_dir: Path) -> bool:
             fallback=False,
         )
         return True  # noqa: TRY300
-    except:  # noqa: E722 # pylint: disable=bare-except
+    # Not found, or not a valid MO file. A truncated MO file raises
+    # `struct.error`, so catch everything.
+    except Exception:  # pylint: disable=broad-except # noqa: BLE001
         return False
 
 
 translations: list[gettext.GNUTranslations] = []
 translations_path: list[Path] = []
+# Translated messages. Cleared when a new domain is loaded.
+_translated: dict[str, str] = {}
 
 
 def load_locale_domain(root_dir: Path, domain: str) -> None:
@@ -139,12 +148,13 @@ def load_locale_domain(root_dir: Path, domain: str) -> None:
         )
         translations.append(translation)
         translations_path.append(locale_dir)
+        _translated.clear()
         logger.info(
             "Gettext domain '%s' in '%s' loaded.",
             str(domain),
             str(root_dir),
         )
-    except:  # noqa: E722 # pylint: disable=bare-except
+    except Exception:  # pylint: disable=broad-except # noqa: BLE001
         logger.warning(
             "Error while loading gettext domain '%s' in '%s'.",
             str(domain),
@@ -183,11 +193,17 @@ def _(message: str) -> str:
         str: Translated message. Return message itself if translation failed.
 
     """
-    for translation in translations:
-        translated = translation.gettext(message)
-        if translated != message:
-            return translated
-    return message
+    res = _translated.get(message)
+    if res is None:
+        # Ask every loaded domain only once for each message.
+        res = message
+        for translation in translations:
+            translated = translation.gettext(message)
+            if translated != message:
+                res = translated
+                break
+        _translated[message] = res
+    return res
 
 
 if len(translations_path) >= 1:
@@ -21,7 +21,6 @@
 
 import logging
 import sys
-from pathlib import Path
 
 import rich
 import rich.logging
@@ -58,8 +57,7 @@ def _init_log_handler(logger_: logging.Logger) -> None:
     logger_.addHandler(logging.NullHandler())
 
     if "--log" in sys.argv:
-        if not Path(LOG_FILE).parent.exists():
-            LOG_FILE.parent.mkdir(exist_ok=True)
+        LOG_FILE.parent.mkdir(exist_ok=True)
         handler = logging.FileHandler(LOG_FILE, encoding=DEFAULT_CHARSET)
         handler.setLevel(LOG_LEVEL)
 
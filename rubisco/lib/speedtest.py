@@ -27,38 +27,61 @@ import aiohttp.client_exceptions
 from rubisco.config import TIMEOUT
 from rubisco.lib.log import logger
 
-__all__ = ["C_INTMAX", "url_speedtest"]
+__all__ = ["C_INTMAX", "speedtest_session", "url_speedtest"]
 
 C_INTMAX = 0xFFFFFFFF
 
 
-async def url_speedtest(url: str) -> int:
+def speedtest_session() -> aiohttp.ClientSession:
+    """Create a client session for speedtest.
+
+    Share one session across probes to reuse its connection pool and DNS
+    cache.
+
+    Returns:
+        aiohttp.ClientSession: The client session. Must be used in a running
+            event loop.
+
+    """
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(TIMEOUT),
+        raise_for_status=False,
+        trust_env=True,
+        read_bufsize=1,  # We don't need to read the response.
+    )
+
+
+async def url_speedtest(
+    url: str,
+    session: aiohttp.ClientSession | None = None,
+) -> int:
     """Test the speed of the given url.
 
     Args:
         url (str): URL to test.
+        session (aiohttp.ClientSession | None, optional): Session to send the
+            request with. A new session is created if not given. Defaults to
+            None.
 
     Returns:
         int: Speed of the given URL. (us)
 
     """
+    if session is None:
+        async with speedtest_session() as new_session:
+            return await url_speedtest(url, new_session)
+
     logger.debug("Testing speed for '%s' ...", url)
     start = time.time_ns()
 
-    async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(TIMEOUT),
-        raise_for_status=False,
-        trust_env=True,
-        read_bufsize=1,  # We don't need to read the response.
-    ) as session:
-        try:
-            async with session.get(url) as response:
-                response.close()
-        except aiohttp.client_exceptions.ClientResponseError:
-            pass  # Response means reachable.
-        except aiohttp.client_exceptions.ClientError:
-            logger.warning("Failed to test speed of '%s'.", url, exc_info=True)
-            return C_INTMAX
-        delta = (time.time_ns() - start) // 1000
-        logger.info("Testing speed for '%s' ... %dus", url, delta)
-        return delta
+    try:
+        async with session.get(url) as response:
+            response.close()
+    except aiohttp.client_exceptions.ClientResponseError:
+        pass  # Response means reachable.
+    except aiohttp.client_exceptions.ClientError:
+        logger.warning("Failed to test speed of '%s'.", url, exc_info=True)
+        return C_INTMAX
+    delta = (time.time_ns() - start) // 1000
+    logger.info("Testing speed for '%s' ... %dus", url, delta)
+    return delta
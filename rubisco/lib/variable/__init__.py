@@ -36,7 +36,9 @@ from rubisco.lib.variable.utils import (
 from rubisco.lib.variable.variable import (
     get_variable,
     pop_variables,
+    pop_variables_bulk,
     push_variables,
+    push_variables_bulk,
     variables,
 )
 
@@ -51,7 +53,9 @@ __all__ = [
     "iter_assert",
     "make_pretty",
     "pop_variables",
+    "pop_variables_bulk",
     "push_variables",
+    "push_variables_bulk",
     "variables",
 ]
 
@@ -98,11 +98,19 @@ class AutoFormatDict(dict[str, Any]):
 
         """
         key = format_str(key, fmt=fmt)
-        res = default
-        for k in self.orig_keys():
-            if format_str(k) == key:
-                res = format_str(self.orig_get(k, self.raise_if_not_found))
-                break
+        # Most keys are literal, look them up by hash first. Only fall back
+        # to formatting and comparing every key if it is not found.
+        res = self.raise_if_not_found
+        if isinstance(key, str) and "$" not in key:
+            res = self.orig_get(key, res)
+        if res is not self.raise_if_not_found:
+            res = format_str(res)
+        else:
+            res = default
+            for k in self.orig_keys():
+                if format_str(k) == key:
+                    res = format_str(self.orig_get(k))
+                    break
 
         if res is self.raise_if_not_found:
             raise KeyError(repr(key))
@@ -371,4 +379,12 @@ class AutoFormatDict(dict[str, Any]):
             bool: If the dict contains the given key.
 
         """
-        return any(k == format_str(key) for k in self.keys())
+        key = format_str(key)
+        # Literal keys are found by hash. Format the key only once otherwise.
+        if (
+            isinstance(key, str)
+            and "$" not in key
+            and super().__contains__(key)
+        ):
+            return True
+        return any(k == key for k in self.keys())
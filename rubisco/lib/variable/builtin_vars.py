@@ -24,31 +24,63 @@ import os
 import platform
 import shutil
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from rubisco.config import APP_VERSION, RUBISCO_COMMAND
-from rubisco.lib.variable.variable import push_variables
+from rubisco.lib.variable.callbacks import add_undefined_var_callback
+from rubisco.lib.variable.variable import (
+    push_variables,
+    push_variables_bulk,
+)
 
 __all__ = ["init_builtin_vars"]
 
 
+def _python_command() -> str:
+    return "python" if shutil.which("python") else "python3"
+
+
+# Built-in variables which are expensive to get. They are pushed on their first
+# use by name, so `get_variables()`, `has_variable()` and python expressions
+# don't see them before that. `uname_result.processor` runs `uname -p` in a
+# subprocess on Linux.
+_LAZY_BUILTIN_VARS: dict[str, Callable[[], object]] = {
+    "host.processor": lambda: platform.uname().processor,
+}
+
+
+def _push_lazy_builtin_var(name: str) -> None:
+    getter = _LAZY_BUILTIN_VARS.get(name)
+    if getter is not None:
+        push_variables(name, getter())
+
+
+# Registered once. `init_builtin_vars()` may be called again.
+add_undefined_var_callback(_push_lazy_builtin_var)
+
+
 def init_builtin_vars() -> None:
-    """Initialize the built-in variables."""
+    """Initialize the built-in variables.
+
+    `host.processor` is not pushed here. It is pushed the first time it is
+    used by name.
+    """
     uname_result = platform.uname()
-    push_variables("home", str(Path.home().absolute()))
-    push_variables("nproc", os.cpu_count())
-    push_variables("rubisco", str(RUBISCO_COMMAND))
-    push_variables("rubisco.version", str(APP_VERSION))
-    push_variables("rubisco.python_version", sys.version)
-    push_variables("rubisco.python_impl", sys.implementation.name)
-    push_variables("host", os.name)
-    push_variables("host.system", uname_result.system)
-    push_variables("host.node", uname_result.node)
-    push_variables("host.release", uname_result.release)
-    push_variables("host.version", uname_result.version)
-    push_variables("host.machine", uname_result.machine)
-    push_variables("host.processor", uname_result.processor)
-    if shutil.which("python"):
-        push_variables("python", "python")
-    else:
-        push_variables("python", "python3")
+    push_variables_bulk(
+        {
+            "home": str(Path.home().absolute()),
+            "nproc": os.cpu_count(),
+            "rubisco": str(RUBISCO_COMMAND),
+            "rubisco.version": str(APP_VERSION),
+            "rubisco.python_version": sys.version,
+            "rubisco.python_impl": sys.implementation.name,
+            "host": os.name,
+            "host.system": uname_result.system,
+            "host.node": uname_result.node,
+            "host.release": uname_result.release,
+            "host.version": uname_result.version,
+            "host.machine": uname_result.machine,
+            "python": _python_command(),
+        },
+    )
@@ -45,6 +45,8 @@ def _exec_variable_type(expr: Expression) -> str | Any:  # noqa: ANN401
         return get_variable(expr.value)
 
     on_undefined_var(expr.value)
+    if has_variable(expr.value):  # Defined by the callbacks.
+        return get_variable(expr.value)
 
     if expr.decoration:
         return execute_expression(expr.decoration)
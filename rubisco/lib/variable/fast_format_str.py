@@ -29,6 +29,7 @@ It is faster than the full format_str() function.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from rubisco.lib.exceptions import RUValueError
@@ -38,6 +39,43 @@ from rubisco.lib.variable.variable import get_variable
 
 __all__ = ["fast_format_str"]
 
+_PYEXPR_RE = re.compile(r"\$\&\{\{.*\}\}")
+_DEFAULT_VALUE_RE = re.compile(r"\$\{\{([^{}]+?):([^{}]+?)\}\}")
+_SIMPLE_VAR_RE = re.compile(r"\$\{\{\s*([a-zA-Z_][a-zA-Z0-9_.-]*)\s*\}\}")
+
+
+@lru_cache(maxsize=256)
+def _compile(string: str) -> tuple[str, ...]:
+    """Check the string and split it into literal text and variable names.
+
+    Messages are formatted with the same template many times, so the result
+    is cached.
+
+    Args:
+        string (str): The string to compile.
+
+    Returns:
+        tuple[str, ...]: Literal text at even indexes and variable names at
+            odd indexes.
+
+    Raises:
+        RUValueError: If the string is not a simple variable expression.
+
+    """
+    if _PYEXPR_RE.search(string):
+        msg = _("fast_format_str() only supports simple variable expressions.")
+        raise RUValueError(
+            msg,
+        )
+
+    if _DEFAULT_VALUE_RE.search(string):
+        msg = _("fast_format_str() does not support default value.")
+        raise RUValueError(
+            msg,
+        )
+
+    return tuple(_SIMPLE_VAR_RE.split(string))
+
 
 def fast_format_str(
     string: str | Any,  # noqa: ANN401
@@ -71,39 +109,22 @@ def fast_format_str(
             (never be Rust), this function will be deprecated.
 
     """
-    if not isinstance(string, str):
+    if not isinstance(string, str) or "$" not in string:
+        # Like format_str(), literal strings skip the compile cache, so they
+        # don't evict the message templates from it.
         return string
 
-    if re.search(r"\$\&\{\{.*\}\}", string):
-        msg = _("fast_format_str() only supports simple variable expressions.")
-        raise RUValueError(
-            msg,
-        )
-
-    if re.search(r"\$\{\{([^{}]+?):([^{}]+?)\}\}", string):
-        msg = _("fast_format_str() does not support default value.")
-        raise RUValueError(
-            msg,
-        )
-
-    matches = re.finditer(
-        r"\$\{\{\s*[a-zA-Z_][a-zA-Z0-9_.-]*\s*\}\}",
-        string,
-    )
-
-    if not matches:
+    parts = _compile(string)
+    if len(parts) == 1:
         return string
 
     with VariableContainer(fmt):
         # If the string only contains a variable, return the variable value
         # without converting to a string.
-        m = re.match(r"^\$\{\{\s*[a-zA-Z_][a-zA-Z0-9_.-]*\s*\}\}$", string)
-        if m:
-            varname = m.group()[3:-2].strip()
-            return get_variable(varname)
-
-        for match in matches:
-            varname = match.group()[3:-2].strip()
-            val = get_variable(varname)
-            string = string.replace(match.group(), str(val))
-    return string
+        if len(parts) == 3 and not parts[0] and not parts[2]:  # noqa: PLR2004
+            return get_variable(parts[1])
+
+        return "".join(
+            str(get_variable(part)) if idx % 2 else part
+            for idx, part in enumerate(parts)
+        )
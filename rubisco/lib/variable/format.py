@@ -19,11 +19,12 @@
 
 """Rubisco string formatter with variable."""
 
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from rubisco.lib.variable.execute import execute_expression
 from rubisco.lib.variable.lexer import get_token
-from rubisco.lib.variable.ru_ast import parse_expression
+from rubisco.lib.variable.ru_ast import Expression, parse_expression
 from rubisco.lib.variable.var_container import VariableContainer
 
 __all__ = ["format_str"]
@@ -32,6 +33,13 @@ __all__ = ["format_str"]
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1024)
+def _compile(string: str) -> Expression:
+    # The AST only depends on the string. Config values are formatted on
+    # every access, so reuse it and only execute it again.
+    return parse_expression(get_token(string))
+
+
 def format_str(
     string: T,
     *,
@@ -51,6 +59,10 @@ def format_str(
     """
     if not isinstance(string, str):
         return string
+    if "$" not in string:
+        # Variables and expressions all start with '$'. Literal strings don't
+        # need to be lexed, parsed and executed.
+        return string
 
     with VariableContainer(fmt):
-        return execute_expression(parse_expression(get_token(string)))
+        return execute_expression(_compile(string))
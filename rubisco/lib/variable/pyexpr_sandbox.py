@@ -51,7 +51,7 @@ def _copy_builtins() -> object:
     for name in dir(builtins):
         setattr(res, name, getattr(builtins, name))
     for name, val in variables.items():
-        setattr(res, name, val.top())
+        setattr(res, name, val[-1])
     return res
 
 
@@ -102,7 +102,7 @@ def eval_pyexpr(expr: str) -> Any:  # noqa: ANN401
 
     # Variables.
     for name, val in variables.items():
-        setattr(builtins_, name, val.top())
+        setattr(builtins_, name, val[-1])
 
     # Disable some built-in functions.
     builtins_.__import__ = get_disabled_function("__import__")  # type: ignore[attr-defined]
@@ -19,6 +19,7 @@
 
 """Rubisco variable system utilities."""
 
+import stat
 from collections.abc import Callable, Iterable
 from pathlib import Path
 from types import UnionType
@@ -35,7 +36,7 @@ __all__ = [
 ]
 
 
-def make_pretty(  # noqa: C901, PLR0912 # pylint: disable=R0912
+def make_pretty(  # noqa: C901 # pylint: disable=R0912
     string: Path | str | Any,  # noqa: ANN401
     empty: str = "",
 ) -> str:
@@ -60,30 +61,32 @@ def make_pretty(  # noqa: C901, PLR0912 # pylint: disable=R0912
     if " " in string_:
         string_ = f"'{string_}'"
 
+    # Get the file type with one lstat call instead of a stat for each
+    # Path.is_*() check.
     strpath = Path(string)
-    if strpath.exists():
-        string_ = f"[underline]{string_}[/underline]"
+    try:
+        mode = strpath.lstat().st_mode
+    except (OSError, ValueError):
+        return string_
 
-    if strpath.is_dir() and not strpath.is_symlink():
+    if stat.S_ISLNK(mode):
+        try:
+            strpath.stat()
+        except (OSError, ValueError):
+            return f"[red]{string_}[/red]"
+        return f"[cyan][underline]{string_}[/underline][/cyan]"
+
+    string_ = f"[underline]{string_}[/underline]"
+    if stat.S_ISDIR(mode):
         string_ = f"[magenta]{string_}[/magenta]"
-    elif strpath.is_block_device() and not strpath.is_symlink():
+    elif stat.S_ISBLK(mode):
         string_ = f"[yellow]{string_}[/yellow]"
-    elif strpath.is_char_device() and not strpath.is_symlink():
+    elif stat.S_ISCHR(mode) or stat.S_ISFIFO(mode):
         string_ = f"[on black][bright_yellow]{string_}[/][/]"
-    elif strpath.is_socket() and not strpath.is_symlink():
+    elif stat.S_ISSOCK(mode):
         string_ = f"[on black][bright_magenta]{string_}[/][/]"
-    elif strpath.is_fifo() and not strpath.is_symlink():
-        string_ = f"[on black][bright_yellow]{string_}[/][/]"
-    else:
-        try:
-            if strpath.is_symlink() and strpath.resolve().exists():
-                string_ = f"[cyan]{string_}[/cyan]"
-            elif strpath.is_symlink():
-                string_ = f"[red]{string_}[/red]"
-            elif strpath.lstat().st_mode & 0o100:
-                string_ = f"[green]{string_}[/green]"
-        except OSError:
-            pass
+    elif mode & 0o100:
+        string_ = f"[green]{string_}[/green]"
 
     return string_
 
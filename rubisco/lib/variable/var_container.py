@@ -28,7 +28,10 @@ original values when the context is exited.
 from types import TracebackType
 from typing import Any
 
-from rubisco.lib.variable.variable import pop_variables, push_variables
+from rubisco.lib.variable.variable import (
+    pop_variables_bulk,
+    push_variables_bulk,
+)
 
 __all__ = ["VariableContainer"]
 
@@ -53,8 +56,7 @@ class VariableContainer:
             VariableContainer: The variable container.
 
         """
-        for key, value in self._fmt.items():
-            push_variables(key, value)
+        push_variables_bulk(self._fmt)
         return self
 
     def __exit__(
@@ -71,5 +73,4 @@ class VariableContainer:
             traceback (Any): The traceback.
 
         """
-        for key in self._fmt:
-            pop_variables(key)
+        pop_variables_bulk(self._fmt)
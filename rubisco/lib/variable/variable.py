@@ -19,21 +19,25 @@
 
 """Rubisco variable system."""
 
+from collections.abc import Iterable, Mapping
 from typing import Any
 
-from rubisco.lib.stack import Stack
 from rubisco.lib.variable.callbacks import undefined_var_callbacks
 
 __all__ = [
     "get_variable",
     "has_variable",
     "pop_variables",
+    "pop_variables_bulk",
     "push_variables",
+    "push_variables_bulk",
     "variables",
 ]
 
-# The global variable container.
-variables: dict[str, Stack[Any]] = {}
+# The global variable container. Each variable is a stack of values, the last
+# item is the top. Plain lists are used, they are much cheaper than a locked
+# queue for each push, pop and lookup.
+variables: dict[str, list[Any]] = {}
 
 
 def push_variables(
@@ -47,11 +51,7 @@ def push_variables(
         value (Any): The value of the variable.
 
     """
-    if name in variables:
-        variables[name].put(value)
-    else:
-        variables[name] = Stack()
-        variables[name].put(value)
+    variables.setdefault(name, []).append(value)
 
 
 def pop_variables(
@@ -72,12 +72,41 @@ def pop_variables(
         Any: The top value of the given variable.
 
     """
-    if name in variables:
-        res = variables[name].get()
-        if variables[name].empty():
-            del variables[name]
-        return res
-    return default
+    stack = variables.get(name)
+    if not stack:
+        return default
+    res = stack.pop()
+    if not stack:
+        del variables[name]
+    return res
+
+
+def push_variables_bulk(values: Mapping[str, Any]) -> None:
+    """Push a new value for each variable in a mapping.
+
+    Args:
+        values (Mapping[str, Any]): Variable names and their values.
+
+    """
+    for name, value in values.items():
+        variables.setdefault(name, []).append(value)
+
+
+def pop_variables_bulk(names: Iterable[str]) -> None:
+    """Pop the top value of each given variable.
+
+    Undefined variables are ignored.
+
+    Args:
+        names (Iterable[str]): The names of the variables.
+
+    """
+    for name in names:
+        stack = variables.get(name)
+        if stack:
+            stack.pop()
+            if not stack:
+                del variables[name]
 
 
 def has_variable(
@@ -107,8 +136,6 @@ def get_variable(
         default (Any): The default value of the variable.
             Defaults to None. If it is None and the variable is not found,
             raise KeyError.
-        src_ref (dict[str, Stack]): The source dictionary.
-            Defaults to `variables`, the global variable container.
 
     Returns:
         Any: The value of the given variable.
@@ -117,15 +144,17 @@ def get_variable(
         KeyError: If the variable is not found.
 
     """
-    if name in variables:
-        return variables[name].top()
+    stack = variables.get(name)
+    if stack:
+        return stack[-1]
 
     # If the variable is not found, call the callbacks.
     for callback in undefined_var_callbacks:
         callback(name)
 
-    if name in variables:
-        return variables[name].top()
+    stack = variables.get(name)
+    if stack:
+        return stack[-1]
 
     if default is None:
         raise KeyError(name)
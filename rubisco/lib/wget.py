@@ -57,16 +57,14 @@ def wget(
 
     logger.debug("Downloading '%s' ...", url)
 
-    content_length = 0
-    with requests.head(url, timeout=TIMEOUT) as response:
-        response.raise_for_status()
-        content_length = int(response.headers.get("Content-Length", 0))
-
+    # One GET request is enough. Its headers carry the Content-Length, so we
+    # don't need a HEAD round trip before it.
     with (
         save_to.open("wb") as file,
         requests.get(url, stream=True, timeout=TIMEOUT) as response,
     ):
         response.raise_for_status()
+        content_length = int(response.headers.get("Content-Length", 0))
         task_msg = fast_format_str(
             _("Downloading ${{url}} ..."),
             fmt={"url": url},
@@ -80,7 +78,6 @@ def wget(
         )
         for chunk in response.iter_content(chunk_size=COPY_BUFSIZE):
             file.write(chunk)
-            file.flush()
             call_ktrigger(
                 IKernelTrigger.on_progress,
                 task_name=task_name,
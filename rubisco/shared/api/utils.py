@@ -29,6 +29,7 @@ from rubisco.lib.fileutil import (
     human_readable_size,
     resolve_path,
     rm_recursive,
+    walk_dir,
 )
 from rubisco.lib.load_module import import_module_from_path
 from rubisco.lib.process import Process
@@ -51,5 +52,6 @@ __all__ = [
     "import_module_from_path",
     "resolve_path",
     "rm_recursive",
+    "walk_dir",
     "wget",
 ]
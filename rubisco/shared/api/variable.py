@@ -21,7 +21,6 @@
 
 from typing import Any
 
-from rubisco.lib.stack import Stack
 from rubisco.lib.variable import (
     AutoFormatDict,
     AutoFormatList,
@@ -32,7 +31,9 @@ from rubisco.lib.variable import (
     iter_assert,
     make_pretty,
     pop_variables,
+    pop_variables_bulk,
     push_variables,
+    push_variables_bulk,
 )
 from rubisco.lib.variable import (
     variables as _variables,
@@ -55,11 +56,13 @@ __all__ = [
     "iter_assert",
     "make_pretty",
     "pop_variables",
+    "pop_variables_bulk",
     "push_variables",
+    "push_variables_bulk",
 ]
 
 
-def get_orig_variables() -> dict[str, Stack[Any]]:
+def get_orig_variables() -> dict[str, list[Any]]:
     """Get original variables list with stack info.
 
     Warning:
@@ -67,7 +70,7 @@ def get_orig_variables() -> dict[str, Stack[Any]]:
         the returned dictionary, it will update the original variables list.
 
     Returns:
-        dict[str, Stack[Any]]: The original variables list with stack info.
+        dict[str, list[Any]]: The original variables list with stack info.
 
     """
     return _variables
@@ -80,4 +83,4 @@ def get_variables() -> dict[str, Any]:
         dict[str, Any]: The variables list.
 
     """
-    return {k: v.top() for k, v in _variables.items()}
+    return {k: v[-1] for k, v in _variables.items()}
@@ -25,6 +25,7 @@ Interface can do something before or after kernel operations.
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Callable
 from functools import partial
 from typing import TYPE_CHECKING, Any
@@ -756,12 +757,15 @@ def call_ktrigger(
     """
     if isinstance(name, Callable):
         name = name.__name__
-    logger.debug(
-        "Calling kernel trigger '%s'(%s). %s",
-        name,
-        repr(kwargs),
-        repr(list(ktriggers.keys())),
-    )
+    # Progress triggers are called for each chunk or file, and they are
+    # rarely logged. Don't build the message if debug logging is off.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Calling kernel trigger '%s'(%r). %r",
+            name,
+            kwargs,
+            list(ktriggers),
+        )
     for instance in ktriggers.values():
         getattr(instance, name, partial(_null_trigger, name))(**kwargs)
 
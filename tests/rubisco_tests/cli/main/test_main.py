@@ -0,0 +1,57 @@
+# -*- mode: python -*-
+# vi: set ft=python :
+
+# Copyright (C) 2024 The C++ Plus Project.
+# This file is part of the Rubisco.
+#
+# Rubisco is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Rubisco is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Test rubisco.cli.main.main module."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Importing the extension loader fails if the fast path is not taken.
+# rubisco.cli replaces sys.stdout, so run it in a child process.
+_SCRIPT = """
+import sys
+sys.modules["rubisco.shared.extension"] = None
+from rubisco.cli.main.main import main
+main()
+"""
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["-v"], ["--version"], ["--log", "-v"], ["--debug", "--version"]],
+)
+def test_version_fast_path(argv: list[str], tmp_path: Path) -> None:
+    """Test "rubisco -v" exits without loading extensions."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _SCRIPT, *argv],
+        cwd=tmp_path,
+        capture_output=True,
+        check=False,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[4])},
+    )
+    if result.returncode != 0:
+        pytest.fail(
+            f"{argv!r} exited with {result.returncode}: "
+            f"{result.stderr.decode()}",
+        )
@@ -45,3 +45,12 @@ def test_load() -> None:
     d = dict(config)
     if d != res:
         pytest.fail(f"Expect {res}, got {d}")
+
+
+def test_load_twice() -> None:
+    """Test for loading the same config file twice."""
+    config1 = RUConfiguration.load_from_file(Path("tests/test.json5"))
+    config1["d"]["aa"] = 0
+    config2 = RUConfiguration.load_from_file(Path("tests/test.json5"))
+    if config2["d"]["aa"] != 11:  # noqa: PLR2004
+        pytest.fail(f"Expect 11, got {config2['d']['aa']}")
@@ -0,0 +1,42 @@
+# -*- mode: python -*-
+# vi: set ft=python :
+
+# Copyright (C) 2024 The C++ Plus Project.
+# This file is part of the Rubisco.
+#
+# Rubisco is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Rubisco is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test rubisco.kernel.git module."""
+
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from rubisco.kernel.git import git_has_remote
+
+
+def test_has_remote(tmp_path: Path) -> None:
+    """Test checking a remote from the repository and its subdirectory."""
+    with Repo.init(tmp_path) as repo:
+        repo.create_remote("origin", "https://example.com/a.git")
+    subdir = tmp_path / "sub"
+    subdir.mkdir()
+
+    if not git_has_remote(tmp_path, "origin"):
+        pytest.fail("Remote 'origin' should exist.")
+    if not git_has_remote(subdir, "origin"):
+        pytest.fail("Remote should be found from a subdirectory.")
+    if git_has_remote(subdir, "mirror"):
+        pytest.fail("Remote 'mirror' should not exist.")
@@ -0,0 +1,58 @@
+# -*- mode: python -*-
+# vi: set ft=python :
+
+# Copyright (C) 2024 The C++ Plus Project.
+# This file is part of the Rubisco.
+#
+# Rubisco is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Rubisco is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test rubisco.kernel.mirrorlist module."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from rubisco.kernel import mirrorlist
+
+
+def test_speedtest_per_website(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only fetches of the same website wait for its speedtest."""
+    # Both speedtests must be running at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    calls: list[str] = []
+
+    async def _find_fastest_mirror(host: str) -> str:
+        calls.append(host)
+        barrier.wait()
+        return f"{host}-mirror"
+
+    monkeypatch.setattr(mirrorlist, "_fastest_mirrors", {})
+    monkeypatch.setattr(
+        mirrorlist,
+        "find_fastest_mirror",
+        _find_fastest_mirror,
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        res = list(
+            executor.map(mirrorlist._get_fastest_mirror, ["a", "b"]),  # noqa: SLF001 # pylint: disable=W0212
+        )
+    if res != ["a-mirror", "b-mirror"]:
+        pytest.fail(f"Unexpected mirrors: {res}")
+
+    # The result is reused, the website is not tested again.
+    if mirrorlist._get_fastest_mirror("a") != "a-mirror":  # noqa: SLF001 # pylint: disable=W0212
+        pytest.fail("The tested mirror should be reused.")
+    if sorted(calls) != ["a", "b"]:
+        pytest.fail(f"Each website should be tested once: {calls}")
@@ -29,6 +29,7 @@ from rubisco.lib.fileutil import (
     TemporaryObject,
     find_command,
     human_readable_size,
+    walk_dir,
 )
 
 
@@ -115,6 +116,15 @@ class TestFileUtil:
         ):
             raise AssertionError
 
+    def test_temp_object_register_missing_path(self) -> None:
+        """Test registering a path which becomes a directory later."""
+        temp = TemporaryObject.register_tempobject(Path("test_tempdir_later"))
+        Path("test_tempdir_later").mkdir()
+        (temp.path / "file").touch()
+        temp.remove()
+        if temp.path.exists():
+            raise AssertionError
+
     def test_temp_object_move(self) -> None:
         """Test temp object's ownership transfer."""
         temp = TemporaryObject.new_file()
@@ -161,3 +171,13 @@ class TestFileUtil:
 
         if find_command("_Not_Exist_Command_", strict=False) is not None:
             raise AssertionError
+
+    def test_walk_dir(self) -> None:
+        """Test walk_dir."""
+        with TemporaryObject.new_directory() as temp:
+            (temp.path / "a" / "b").mkdir(parents=True)
+            (temp.path / "a" / "b" / "c.txt").touch()
+            (temp.path / "d.txt").touch()
+            res = set(walk_dir(temp.path))
+            if res != set(temp.path.rglob("*")):
+                raise AssertionError
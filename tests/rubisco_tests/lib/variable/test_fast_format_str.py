@@ -94,3 +94,19 @@ class TestFastFormatStr:
             fast_format_str,
             "${{var:$&{{1+1}}}}",
         )
+
+    def test_reuse_template(self) -> None:
+        """Test formatting the same template with different variables."""
+        template = "Subpackage ${{name}} of ${{ pkg }}."
+        if (
+            fast_format_str(template, fmt={"name": "a", "pkg": "x"})
+            != "Subpackage a of x."
+        ):
+            pytest.fail("Variable should be replaced.")
+        if (
+            fast_format_str(template, fmt={"name": "b", "pkg": "y"})
+            != "Subpackage b of y."
+        ):
+            pytest.fail("Cached template should use the new variables.")
+        with pytest.raises(RUValueError):
+            fast_format_str("${{var:1}}")
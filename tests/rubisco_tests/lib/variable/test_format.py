@@ -21,6 +21,8 @@
 
 import pytest
 
+from rubisco.lib.variable.builtin_vars import init_builtin_vars
+from rubisco.lib.variable.callbacks import undefined_var_callbacks
 from rubisco.lib.variable.format import format_str
 from rubisco.lib.variable.variable import variables
 
@@ -60,3 +62,28 @@ class TestFormatStr:
         self._reset()
         if format_str("hello ${{var:$&{{1+1}}}}}}") != "hello 2}}":
             pytest.fail("format_str() should return the formatted string")
+
+    def test_builtin_var_in_pyexpr(self) -> None:
+        """Test using a built-in variable in python expression."""
+        self._reset()
+        init_builtin_vars()
+        if format_str("$&{{ python }}") not in {"python", "python3"}:
+            pytest.fail("Built-in variables should be visible in pyexpr")
+
+    def test_lazy_builtin_var(self) -> None:
+        """Test the built-in variables which are pushed on first use."""
+        self._reset()
+        callbacks = len(undefined_var_callbacks)
+        init_builtin_vars()
+        if len(undefined_var_callbacks) != callbacks:
+            pytest.fail("Callbacks should not be registered again.")
+        if not isinstance(format_str("${{ host.processor }}"), str):
+            pytest.fail("host.processor should be pushed on first use.")
+
+    def test_reuse(self) -> None:
+        """Test formatting the same string with different variables."""
+        self._reset()
+        if format_str("${{var}}!", fmt={"var": "a"}) != "a!":
+            pytest.fail("format_str() should return the formatted string")
+        if format_str("${{var}}!", fmt={"var": "b"}) != "b!":
+            pytest.fail("format_str() should use the new variable value")
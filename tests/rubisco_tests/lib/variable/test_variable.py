@@ -25,7 +25,9 @@ from rubisco.lib.variable.variable import (
     get_variable,
     has_variable,
     pop_variables,
+    pop_variables_bulk,
     push_variables,
+    push_variables_bulk,
     variables,
 )
 
@@ -72,3 +74,17 @@ class TestVariable:
         push_variables("a", 1)
         if pop_variables("a", default=2) != 1:
             pytest.fail("Variable a should be 1.")
+
+    def test_push_pop_variables_bulk(self) -> None:
+        """Test push and pop variables in bulk."""
+        self._reset()
+        push_variables("a", 1)
+        push_variables_bulk({"a": 2, "b": 3})
+        if get_variable("a") != 2 or get_variable("b") != 3:  # noqa: PLR2004
+            pytest.fail("Variables a and b should be 2 and 3.")
+
+        pop_variables_bulk(["a", "b", "c"])
+        if get_variable("a") != 1:
+            pytest.fail("Variable a should be 1.")
+        if has_variable("b") is True:
+            pytest.fail("Variable b should not exist.")